@@ -0,0 +1,36 @@
+"""create generated_tags
+
+Revision ID: 3f9c2a7d1b04
+Revises: 
+Create Date: 2026-10-17 10:12:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d1b04'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'generated_tags',
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('model_name', sa.String(), nullable=False),
+        sa.Column('prompt_version', sa.String(), nullable=False),
+        sa.Column('tags', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('content_hash')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('generated_tags')
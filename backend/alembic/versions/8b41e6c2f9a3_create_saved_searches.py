@@ -0,0 +1,46 @@
+"""create saved_searches
+
+Revision ID: 8b41e6c2f9a3
+Revises: 3f9c2a7d1b04
+Create Date: 2026-10-17 14:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b41e6c2f9a3'
+down_revision: Union[str, Sequence[str], None] = '3f9c2a7d1b04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'saved_searches',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('query', sa.String(), nullable=False),
+        sa.Column('normalized_query', sa.String(), nullable=False),
+        sa.Column('platform', sa.String(), nullable=False),
+        sa.Column('min_price', sa.Integer(), nullable=True),
+        sa.Column('max_price', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_saved_searches_id'), 'saved_searches', ['id'], unique=False)
+    op.create_index(op.f('ix_saved_searches_user_id'), 'saved_searches', ['user_id'], unique=False)
+    op.create_index(op.f('ix_saved_searches_normalized_query'), 'saved_searches', ['normalized_query'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_saved_searches_normalized_query'), table_name='saved_searches')
+    op.drop_index(op.f('ix_saved_searches_user_id'), table_name='saved_searches')
+    op.drop_index(op.f('ix_saved_searches_id'), table_name='saved_searches')
+    op.drop_table('saved_searches')
@@ -0,0 +1,46 @@
+"""create items
+
+Revision ID: c57d0e9a4b12
+Revises: 8b41e6c2f9a3
+Create Date: 2026-10-17 16:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c57d0e9a4b12'
+down_revision: Union[str, Sequence[str], None] = '8b41e6c2f9a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_table(
+        'items',
+        sa.Column('platform', sa.String(), nullable=False),
+        sa.Column('item_id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('price', sa.Integer(), nullable=False),
+        sa.Column('thumbnail', sa.String(), nullable=False),
+        sa.Column('tags', postgresql.JSONB(astext_type=sa.Text()), server_default='[]', nullable=False),
+        sa.Column('seen_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('platform', 'item_id')
+    )
+    op.create_index(op.f('ix_items_seen_at'), 'items', ['seen_at'], unique=False)
+    op.create_index('ix_items_name_trgm', 'items', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_items_name_fts', 'items', [sa.text("to_tsvector('simple', name)")], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_items_name_fts', table_name='items')
+    op.drop_index('ix_items_name_trgm', table_name='items')
+    op.drop_index(op.f('ix_items_seen_at'), table_name='items')
+    op.drop_table('items')
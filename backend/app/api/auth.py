@@ -1,22 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models.user import User
 from app.schemas.auth import UserRegister, UserResponse, ChangePassword, LogoutResponse, LoginResponse, ChangePasswordResponse
-from app.core.security import verify_password, get_password_hash, create_access_token
-from app.core.redis import RedisTokenBlacklist
-from app.core.config import settings
+from app.core.security import create_access_token
+from app.core.hashing import password_hasher
+from app.core.redis import RedisTokenBlacklist, publish_user_invalidation
+from app.core.auth_cache import decode_token, invalidate_user, local_token_blacklist, token_id
 from app.api.deps import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+async def get_user_by_user_id(db: AsyncSession, user_id: str):
+    result = await db.execute(select(User).where(User.user_id == user_id))
+    return result.scalar_one_or_none()
+
 @router.get("/check/{user_id}")
-def check_user_id_availability(user_id: str, db: Session = Depends(get_db)):
+async def check_user_id_availability(user_id: str, db: AsyncSession = Depends(get_async_db)):
     normalized_user_id = user_id.lower()
 
-    existing_user = db.query(User).filter(User.user_id == normalized_user_id).first()
+    existing_user = await get_user_by_user_id(db, normalized_user_id)
 
     if existing_user:
         return {"available": False, "message": "This ID is already in use"}
@@ -24,57 +30,77 @@ def check_user_id_availability(user_id: str, db: Session = Depends(get_db)):
         return {"available": True, "message": "This ID is available"}
 
 @router.post("/register", response_model=UserResponse)
-def register(user_data: UserRegister, db: Session = Depends(get_db)):
-    if db.query(User).filter(User.user_id == user_data.user_id).first():
+async def register(user_data: UserRegister, db: AsyncSession = Depends(get_async_db)):
+    if await get_user_by_user_id(db, user_data.user_id):
         raise HTTPException(
             status_code=400,
             detail="This user ID is already in use"
         )
 
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await password_hasher.hash(user_data.password)
     new_user = User(user_id=user_data.user_id, hashed_password=hashed_password)
 
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     return UserResponse(user=new_user)
 
 @router.post("/login", response_model=LoginResponse)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.user_id == form_data.username.lower()).first()
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    user = await get_user_by_user_id(db, form_data.username.lower())
+
+    verified, new_hashed_password = (False, None)
+    if user:
+        verified, new_hashed_password = await password_hasher.verify_and_update(form_data.password, user.hashed_password)
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user ID or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # bcrypt cost가 바뀌었으면 새 설정으로 다시 해싱해 저장
+    if new_hashed_password:
+        user.hashed_password = new_hashed_password
+        await db.commit()
+        invalidate_user(user.user_id)
+        await publish_user_invalidation(user.user_id)
+
     access_token = create_access_token(data={"sub": user.user_id})
     return LoginResponse(access_token=access_token)
 
 @router.post("/change-password", response_model=ChangePasswordResponse)
-def change_password(
+async def change_password(
     password_data: ChangePassword,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    verified, _ = await password_hasher.verify_and_update(password_data.current_password, current_user.hashed_password)
+    if not verified:
         raise HTTPException(
             status_code=400,
             detail="Your current password is incorrect"
         )
 
-    new_hashed_password = get_password_hash(password_data.new_password)
-    current_user.hashed_password = new_hashed_password
-    db.commit()
+    new_hashed_password = await password_hasher.hash(password_data.new_password)
+    # 캐시된 사용자는 세션에 붙어있지 않을 수 있어 다시 조회
+    user = await db.get(User, current_user.id)
+    user.hashed_password = new_hashed_password
+    await db.commit()
+
+    invalidate_user(user.user_id)
+    await publish_user_invalidation(user.user_id)
 
     return ChangePasswordResponse(message="Password changed successfully")
 
 @router.post("/logout", response_model=LogoutResponse)
-def logout(
+async def logout(
     token: str = Depends(oauth2_scheme),
     current_user: User = Depends(get_current_user), # 토큰 유효성 검증
 ):
-    RedisTokenBlacklist.add_token(token, settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    payload = decode_token(token)
+    jti = token_id(token, payload)
+    await RedisTokenBlacklist.add_token(jti, payload["exp"])
+    local_token_blacklist.add(jti, payload["exp"])
     return LogoutResponse(message="Successfully logged out")
@@ -1,27 +1,38 @@
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
-from app.core.config import settings
-from app.database import get_db
+from jose import JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models.user import User
 from app.core.redis import RedisTokenBlacklist
+from app.core.auth_cache import decode_token, local_token_blacklist, token_id, user_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    if RedisTokenBlacklist.is_blacklisted(token):
-            raise HTTPException(status_code=401, detail="Token has been invalidated")
+async def is_token_blacklisted(jti: str) -> bool:
+    blacklisted = local_token_blacklist.is_blacklisted(jti)
+    if blacklisted is None:
+        blacklisted = await RedisTokenBlacklist.is_blacklisted(jti)
+    return blacklisted
 
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid token")
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = db.query(User).filter(User.user_id == user_id).first()
+    if await is_token_blacklisted(token_id(token, payload)):
+            raise HTTPException(status_code=401, detail="Token has been invalidated")
+
+    user = user_cache.get(user_id)
     if user is None:
-        raise HTTPException(status_code=401, detail="User not found")
+        result = await db.execute(select(User).where(User.user_id == user_id))
+        user = result.scalar_one_or_none()
+        if user is None:
+            raise HTTPException(status_code=401, detail="User not found")
+        user_cache.set(user_id, user)
     return user
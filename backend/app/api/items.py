@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, Query
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
-from app.schemas.item import GetAutocompleteResponse, ItemSearchResponse
+from app.schemas.item import GetAutocompleteResponse, ItemSearchResponse, PriceStatsResponse
 from app.api.deps import get_current_user
 from app.models.user import User
 from app.services.search import search_service
+from app.api.responses import RecordJSONResponse
+from app.core.config import settings
 
 router = APIRouter(prefix="/items", tags=["Items"])
 
@@ -15,13 +19,54 @@ async def get_autocomplete(
     response = await search_service.get_autocomplete(query, limit)
     return response
 
-@router.get("/search", response_model=ItemSearchResponse)
+@router.get("/search", response_model=ItemSearchResponse, response_class=RecordJSONResponse)
 async def search_items(
     query: str = Query(..., min_length=1, max_length=100),
-    platform: Optional[str] = Query("all", pattern="^(bunjang|joonggonara|all)$"),
+    platform: Optional[str] = Query("all", pattern="^(bunjang|joongna|all)$"),
     min_price: Optional[int] = Query(None, ge=0),
     max_price: Optional[int] = Query(None, ge=0),
+    cursor: Optional[str] = Query(None, max_length=1024),
+    page_size: int = Query(settings.SEARCH_PAGE_SIZE, ge=1, le=100),
+    sort: str = Query("relevance", pattern="^(relevance|price_asc|price_desc)$"),
+    source: str = Query("live", pattern="^(local|live|hybrid)$"),
     current_user: User = Depends(get_current_user)
 ):
-    response = await search_service.search_items(query, platform, min_price, max_price)
+    try:
+        result = await search_service.search_items(query, platform, min_price, max_price, cursor, page_size, sort, source)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Response를 직접 반환해 response_model 재검증을 건너뜀
+    return RecordJSONResponse(result)
+
+@router.get("/price-stats", response_model=PriceStatsResponse)
+async def get_price_stats(
+    query: str = Query(..., min_length=1, max_length=100),
+    platform: Optional[str] = Query("all", pattern="^(bunjang|joongna|all)$"),
+    bins: int = Query(10, ge=1, le=50),
+    current_user: User = Depends(get_current_user)
+):
+    response = await search_service.get_price_stats(query, platform, bins)
     return response
+
+@router.get("/search/stream")
+async def stream_search_items(
+    query: str = Query(..., min_length=1, max_length=100),
+    platform: Optional[str] = Query("all", pattern="^(bunjang|joongna|all)$"),
+    min_price: Optional[int] = Query(None, ge=0),
+    max_price: Optional[int] = Query(None, ge=0),
+    cursor: Optional[str] = Query(None, max_length=1024),
+    page_size: int = Query(settings.SEARCH_PAGE_SIZE, ge=1, le=100),
+    current_user: User = Depends(get_current_user)
+):
+    events = search_service.stream_items(query, platform, min_price, max_price, cursor, page_size)
+    try:
+        first_event = await events.__anext__()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def ndjson():
+        yield json.dumps(first_event, ensure_ascii=False) + "\n"
+        async for event in events:
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
 from app.models.user import User
 from app.models.connected_platform import ConnectedPlatform
 from app.schemas.platform import ConnectedPlatformCreate, ConnectedPlatformResponse
@@ -10,15 +11,16 @@ from app.core.encryption import encrypt_credentials
 router = APIRouter(prefix="/platforms", tags=["Connected platforms"])
 
 @router.post("/connect", response_model=ConnectedPlatformResponse)
-def connect_platform(
+async def connect_platform(
     platform_data: ConnectedPlatformCreate,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    existing = db.query(ConnectedPlatform).filter(
+    result = await db.execute(select(ConnectedPlatform).where(
         ConnectedPlatform.user_id == current_user.id,
         ConnectedPlatform.platform_name == platform_data.platform_name
-    ).first()
+    ))
+    existing = result.scalars().first()
 
     if existing:
         raise HTTPException(status_code=400, detail="platform already connected")
@@ -33,32 +35,34 @@ def connect_platform(
     )
 
     db.add(new_platform)
-    db.commit()
-    db.refresh(new_platform)
+    await db.commit()
+    await db.refresh(new_platform)
     return new_platform
 
 @router.get("/", response_model=list[ConnectedPlatformResponse])
-def get_connected_platforms(
+async def get_connected_platforms(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    platforms = db.query(ConnectedPlatform).filter(ConnectedPlatform.user_id == current_user.id).all()
+    result = await db.execute(select(ConnectedPlatform).where(ConnectedPlatform.user_id == current_user.id))
+    platforms = result.scalars().all()
     return platforms
 
 @router.delete("/{platform_name}")
-def disconnect_platform(
+async def disconnect_platform(
     platform_name: str,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    platform = db.query(ConnectedPlatform).filter(
+    result = await db.execute(select(ConnectedPlatform).where(
         ConnectedPlatform.platform_name == platform_name,
         ConnectedPlatform.user_id == current_user.id
-    ).first()
+    ))
+    platform = result.scalars().first()
 
     if not platform:
         raise HTTPException(status_code=404, detail="platform not found")
 
-    db.delete(platform)
-    db.commit()
+    await db.delete(platform)
+    await db.commit()
     return {"message": "platform disconnected successfully"}
@@ -0,0 +1,10 @@
+import orjson
+from typing import Any
+from fastapi.responses import Response
+
+class RecordJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        # orjson은 slots dataclass를 그대로 직렬화하므로 pydantic 검증을 거치지 않음
+        return orjson.dumps(content)
@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.database import get_async_db
+from app.models.user import User
+from app.models.saved_search import SavedSearch
+from app.schemas.saved_search import SavedSearchCreate, SavedSearchResponse, SavedSearchMatchesResponse
+from app.api.deps import get_current_user
+from app.services.saved_search import saved_search_scheduler
+from app.utils.text import normalize_query
+
+router = APIRouter(prefix="/saved-searches", tags=["Saved searches"])
+
+async def get_saved_search(saved_search_id: int, current_user: User, db: AsyncSession) -> SavedSearch:
+    saved_search = await db.get(SavedSearch, saved_search_id)
+    if not saved_search or saved_search.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="saved search not found")
+    return saved_search
+
+@router.post("/", response_model=SavedSearchResponse)
+async def create_saved_search(
+    saved_search_data: SavedSearchCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    query = " ".join(saved_search_data.query.split())
+    if not query:
+        raise HTTPException(status_code=400, detail="query must not be blank")
+
+    # 저장된 검색은 주기마다 업스트림을 호출하므로 사용자당 개수를 제한
+    saved_search_count = await db.scalar(select(func.count()).select_from(SavedSearch).where(SavedSearch.user_id == current_user.id))
+    if saved_search_count >= settings.SAVED_SEARCH_MAX_PER_USER:
+        raise HTTPException(status_code=409, detail=f"at most {settings.SAVED_SEARCH_MAX_PER_USER} saved searches per user")
+
+    saved_search = SavedSearch(
+        user_id=current_user.id,
+        query=query,
+        normalized_query=normalize_query(query),
+        platform=saved_search_data.platform,
+        min_price=saved_search_data.min_price,
+        max_price=saved_search_data.max_price
+    )
+
+    db.add(saved_search)
+    await db.commit()
+    await db.refresh(saved_search)
+    return saved_search
+
+@router.get("/", response_model=list[SavedSearchResponse])
+async def get_saved_searches(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    result = await db.execute(select(SavedSearch).where(SavedSearch.user_id == current_user.id))
+    saved_searches = result.scalars().all()
+    return saved_searches
+
+@router.get("/{saved_search_id}/matches", response_model=SavedSearchMatchesResponse)
+async def get_saved_search_matches(
+    saved_search_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    saved_search = await get_saved_search(saved_search_id, current_user, db)
+    matches = await saved_search_scheduler.get_matches(saved_search.id)
+    return SavedSearchMatchesResponse(saved_search_id=saved_search.id, items=matches, item_count=len(matches))
+
+@router.delete("/{saved_search_id}/matches")
+async def clear_saved_search_matches(
+    saved_search_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    saved_search = await get_saved_search(saved_search_id, current_user, db)
+    await saved_search_scheduler.clear_matches(saved_search.id)
+    return {"message": "matches cleared successfully"}
+
+@router.delete("/{saved_search_id}")
+async def delete_saved_search(
+    saved_search_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    saved_search = await get_saved_search(saved_search_id, current_user, db)
+    await db.delete(saved_search)
+    await db.commit()
+    await saved_search_scheduler.clear_matches(saved_search_id)
+    return {"message": "saved search deleted successfully"}
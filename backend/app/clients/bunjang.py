@@ -1,8 +1,15 @@
-import httpx, urllib.parse
+import urllib.parse
+from app.clients.http import http_clients
+from app.clients.parsing import loads
+from app.clients.resilience import resilient
+from app.core.config import settings
 
 class BunjangAPI():
+    BASE_URL = "https://api.bunjang.co.kr"
+
+    @resilient("bunjang")
     async def get_autocomplete(self, query: str, suggestion_type: str = "product", version: int = 2):
-        url = "https://api.bunjang.co.kr/api/1/search/suggests_keyword.json"
+        url = f"{self.BASE_URL}/api/1/search/suggests_keyword.json"
         encoded_query = urllib.parse.quote(query)
 
         params = {
@@ -12,23 +19,21 @@ class BunjangAPI():
         }
         headers = {
             'accept': 'application/json, text/plain, */*',
-            'accept-language': 'ko,en;q=0.9',
             'origin': 'https://m.bunjang.co.kr',
-            'referer': 'https://m.bunjang.co.kr/',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36'
+            'referer': 'https://m.bunjang.co.kr/'
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await http_clients.request("GET", url, params=params, headers=headers, timeout=settings.UPSTREAM_TIMEOUTS["autocomplete"])
+        response.raise_for_status()
+        return loads(response.content, "bunjang.autocomplete")
 
-    async def search_items(self, query: str, page: int = 0, limit: int = 100):
-        url = "https://api.bunjang.co.kr/api/1/find_v2.json"
+    @resilient("bunjang")
+    async def search_items(self, query: str, page: int = 0, limit: int = 100, order: str = "score"):
+        url = f"{self.BASE_URL}/api/1/find_v2.json"
 
         params = {
             'q': query,
-            'order': 'score',
+            'order': order,
             'page': page,
             'n': limit,
             'stat_device': 'w',
@@ -38,33 +43,28 @@ class BunjangAPI():
         }
         headers = {
             'accept': 'application/json',
-            'accept-language': 'ko,en;q=0.9',
             'origin': 'https://m.bunjang.co.kr',
-            'referer': 'https://m.bunjang.co.kr/',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36'
+            'referer': 'https://m.bunjang.co.kr/'
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await http_clients.request("GET", url, params=params, headers=headers, timeout=settings.UPSTREAM_TIMEOUTS["search"])
+        response.raise_for_status()
+        return loads(response.content, "bunjang.search")
 
+    @resilient("bunjang", hedge=True)
     async def get_item_details(self, item_id: str, viewer_uid: int = -1):
-        url = f"https://api.bunjang.co.kr/api/pms/v3/products-detail/{item_id}"
+        url = f"{self.BASE_URL}/api/pms/v3/products-detail/{item_id}"
 
         params = {
             'viewerUid': viewer_uid
         }
         headers = {
             'accept': 'application/json, text/plain, */*',
-            'accept-language': 'ko,en;q=0.9',
             'origin': 'https://m.bunjang.co.kr',
             'referer': 'https://m.bunjang.co.kr/',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36',
             'x-bun-auth-token': ''
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await http_clients.request("GET", url, params=params, headers=headers, timeout=settings.UPSTREAM_TIMEOUTS["detail"])
+        response.raise_for_status()
+        return loads(response.content, "bunjang.detail")
@@ -0,0 +1,60 @@
+import httpx
+from typing import Dict
+from urllib.parse import urlsplit
+from app.core.config import settings
+from app.clients.rate_limit import rate_limiter
+
+DEFAULT_HEADERS = {
+    'accept-language': 'ko,en;q=0.9',
+    'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36'
+}
+
+class HTTPClientPool:
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+
+        client = self._clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY
+                ),
+                timeout=settings.HTTP_TIMEOUT,
+                http2=settings.HTTP2_ENABLED
+            )
+            self._clients[origin] = client
+        return client
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        client = self.get_client(url)
+        if not settings.RATE_LIMIT_ENABLED:
+            return await client.request(method, url, **kwargs)
+
+        host = urlsplit(url).netloc
+        await rate_limiter.acquire(host)
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TimeoutException:
+            rate_limiter.record(host, throttled=True)
+            raise
+        rate_limiter.record(host, throttled=response.status_code == 429 or response.status_code >= 500)
+        return response
+
+    def open(self, *urls: str):
+        for url in urls:
+            self.get_client(url)
+
+    async def close(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+http_clients = HTTPClientPool()
@@ -1,65 +1,136 @@
-import httpx, urllib.parse
+import re, time, urllib.parse
+from typing import Optional
+from app.clients.http import http_clients
+from app.clients.parsing import loads
+from app.clients.resilience import resilient
+from app.core.config import settings
+from app.core.redis import async_redis_client
+from app.utils.singleflight import SingleFlight
+
+BUILD_ID_PATTERN = re.compile(r'"buildId"\s*:\s*"([^"]+)"')
+
+class JoongnaBuildIdResolver:
+    REDIS_KEY = "joongna:build_id"
+
+    def __init__(self, web_url: str, ttl: int = settings.JOONGNA_BUILD_ID_TTL):
+        self.web_url = web_url
+        self.ttl = ttl
+        self._build_id: Optional[str] = None
+        self._verified_at = float("-inf")
+        self._flight = SingleFlight()
+
+    def recently_verified(self) -> bool:
+        return time.monotonic() - self._verified_at < settings.JOONGNA_BUILD_ID_RECHECK_INTERVAL
+
+    async def get(self) -> str:
+        if self._build_id is None:
+            self._build_id = await self._load() or await self.refresh()
+        return self._build_id
+
+    async def refresh(self, stale_build_id: Optional[str] = None) -> str:
+        return await self._flight.do("refresh", lambda: self._refresh(stale_build_id))
+
+    async def _refresh(self, stale_build_id: Optional[str]) -> str:
+        # 다른 워커가 이미 새 값을 찾아뒀으면 그대로 사용
+        cached = await self._load()
+        if cached and cached != stale_build_id:
+            self._build_id = cached
+            self._verified_at = time.monotonic()
+            return cached
+
+        response = await http_clients.request("GET", f"{self.web_url}/", headers={'accept': 'text/html'}, timeout=settings.UPSTREAM_TIMEOUTS["build_id"])
+        response.raise_for_status()
+        match = BUILD_ID_PATTERN.search(response.text)
+        if match is None:
+            raise RuntimeError("Joongna build id not found in page")
+
+        self._build_id = match.group(1)
+        self._verified_at = time.monotonic()
+        try:
+            await async_redis_client.set(self.REDIS_KEY, self._build_id, ex=self.ttl)
+        except Exception as e:
+            print(f"Joongna build id cache write failed: {e}")
+        return self._build_id
+
+    async def _load(self) -> Optional[str]:
+        try:
+            return await async_redis_client.get(self.REDIS_KEY)
+        except Exception as e:
+            print(f"Joongna build id cache read failed: {e}")
+            return None
 
 class JoongnaAPI():
+    SEARCH_API_URL = "https://search-api.joongna.com"
+    WEB_URL = "https://web.joongna.com"
+
+    def __init__(self):
+        self.build_id_resolver = JoongnaBuildIdResolver(self.WEB_URL)
+
+    @resilient("joongna")
     async def get_autocomplete(self, keyword: str, keyword_count: int = 10):
-        url = "https://search-api.joongna.com/v25/search/autocomplete/keyword"
+        url = f"{self.SEARCH_API_URL}/v25/search/autocomplete/keyword"
 
         headers = {
             'accept': 'application/json, text/plain, */*',
-            'accept-language': 'ko,en;q=0.9',
             'content-type': 'application/json',
             'origin': 'https://web.joongna.com',
             'os-type': '2',
-            'referer': 'https://web.joongna.com/',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36'
+            'referer': 'https://web.joongna.com/'
         }
         data = {
             "keyword": keyword,
             "keywordCnt": keyword_count
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=data, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        response = await http_clients.request("POST", url, json=data, headers=headers, timeout=settings.UPSTREAM_TIMEOUTS["autocomplete"])
+        response.raise_for_status()
+        return loads(response.content, "joongna.autocomplete")
 
-    async def search_items(self, query: str, build_id: str = "IbsrShCh_D7Jq0fPM02Yw"):
+    @resilient("joongna")
+    async def search_items(self, query: str, page: int = 1, build_id: Optional[str] = None, sort: Optional[str] = None):
         encoded_query = urllib.parse.quote(query)
-        url = f"https://web.joongna.com/_next/data/{build_id}/search/{encoded_query}.json"
 
         params = {
             'keywordSource': 'SUGGESTED_KEYWORD',
-            'keyword': query
+            'keyword': query,
+            'page': page
         }
+        if sort is not None:
+            params['sort'] = sort
         headers = {
             'accept': '*/*',
-            'accept-language': 'ko,en;q=0.9',
             'referer': f'https://web.joongna.com/search/{encoded_query}',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36',
             'x-nextjs-data': '1'
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        return await self._get_next_data(f"search/{encoded_query}.json", params, headers, build_id, "search")
 
-    async def get_item_details(self, item_id: str, build_id: str = "IbsrShCh_D7Jq0fPM02Yw"):
+    @resilient("joongna", hedge=True)
+    async def get_item_details(self, item_id: str, build_id: Optional[str] = None):
         encoded_product_seq = urllib.parse.quote(item_id)
-        url = f"https://web.joongna.com/_next/data/{build_id}/product/{encoded_product_seq}.json"
 
         params = {
             'productSeq': item_id
         }
         headers = {
             'accept': '*/*',
-            'accept-language': 'ko,en;q=0.9',
             'referer': 'https://web.joongna.com/',
-            'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36',
             'x-nextjs-data': '1'
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        return await self._get_next_data(f"product/{encoded_product_seq}.json", params, headers, build_id, "detail")
+
+    async def _get_next_data(self, path: str, params: dict, headers: dict, build_id: Optional[str] = None, endpoint: str = "search"):
+        timeout = settings.UPSTREAM_TIMEOUTS[endpoint]
+        resolved_build_id = build_id or await self.build_id_resolver.get()
+        response = await http_clients.request("GET", f"{self.WEB_URL}/_next/data/{resolved_build_id}/{path}", params=params, headers=headers, timeout=timeout)
+
+        # 중고나라가 재배포되면 이전 build id는 404가 되므로 한 번만 갱신 후 재시도
+        # 삭제/판매된 상품도 404라서 최근에 확인한 build id거나 갱신해도 같으면 그대로 404 처리
+        if response.status_code == 404 and build_id is None and not self.build_id_resolver.recently_verified():
+            refreshed_build_id = await self.build_id_resolver.refresh(resolved_build_id)
+            if refreshed_build_id != resolved_build_id:
+                response = await http_clients.request("GET", f"{self.WEB_URL}/_next/data/{refreshed_build_id}/{path}", params=params, headers=headers, timeout=timeout)
+
+        response.raise_for_status()
+        return loads(response.content, f"joongna.{endpoint}")
@@ -0,0 +1,43 @@
+import orjson, time
+from dataclasses import dataclass
+from typing import Any, List, Optional
+from app.core.metrics import UPSTREAM_PARSE_BYTES, UPSTREAM_PARSE_DURATION
+
+def loads(content: bytes, source: str) -> Any:
+    started = time.perf_counter()
+    payload = orjson.loads(content)
+    UPSTREAM_PARSE_DURATION.labels(source=source).observe(time.perf_counter() - started)
+    UPSTREAM_PARSE_BYTES.labels(source=source).inc(len(content))
+    return payload
+
+@dataclass(slots=True)
+class JoongnaProductRecord:
+    title: str
+    description: str
+    category: str
+    labels: List[str]
+
+def find_query_data(payload: dict, required_key: str) -> Optional[dict]:
+    # dehydratedState의 query 순서는 배포마다 바뀔 수 있어 필요한 키로 찾음
+    for query in payload["pageProps"]["dehydratedState"]["queries"]:
+        data = (query.get("state") or {}).get("data") or {}
+        if isinstance(data, dict) and isinstance(data.get("data"), dict) and required_key in data["data"]:
+            return data["data"]
+    return None
+
+def parse_joongna_search_items(payload: dict) -> List[dict]:
+    data = find_query_data(payload, "items")
+    if data is None:
+        raise ValueError("Joongna search items not found in response")
+    return data["items"]
+
+def parse_joongna_product(payload: dict) -> JoongnaProductRecord:
+    data = find_query_data(payload, "productTitle")
+    if data is None:
+        raise ValueError("Joongna product detail not found in response")
+    return JoongnaProductRecord(
+        title=data["productTitle"],
+        description=data["productDescription"],
+        category=data["categoryName"],
+        labels=data["labels"]
+    )
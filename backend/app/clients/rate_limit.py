@@ -0,0 +1,110 @@
+import asyncio
+from collections import defaultdict
+from typing import Dict, Set
+from app.core.config import settings
+from app.core.metrics import RATE_LIMIT_ACQUIRES, RATE_LIMIT_RATE, RATE_LIMIT_WAIT, UPSTREAM_THROTTLED_RESPONSES
+from app.core.redis import async_redis_client
+
+# 요청 하나당 Redis 호출 한 번: 직전 요청들의 결과로 속도를 조정(AIMD)한 뒤 토큰을 예약함
+# 성공하면 조금씩 올리고, 429/5xx면 쿨다운마다 한 번만 절반으로 줄임
+# 토큰이 부족하면 미리 예약(음수 잔량)하고 기다릴 시간을 돌려줌, max_wait을 넘으면 -1
+ACQUIRE_SCRIPT = """
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "updated_at", "rate", "decreased_at")
+local burst = tonumber(ARGV[2])
+local rate = tonumber(state[3]) or tonumber(ARGV[1])
+local tokens = tonumber(state[1]) or burst
+local updated_at = tonumber(state[2]) or now
+local decreased_at = tonumber(state[4]) or 0
+
+tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate)
+
+if ARGV[5] == "1" then
+    if now - decreased_at >= tonumber(ARGV[10]) then
+        rate = math.max(tonumber(ARGV[6]), rate * tonumber(ARGV[9]))
+        decreased_at = now
+    end
+else
+    rate = math.min(tonumber(ARGV[7]), rate + tonumber(ARGV[4]) * tonumber(ARGV[8]))
+end
+
+local wait = 0
+if tokens < 1 then
+    wait = (1 - tokens) / rate
+    if wait > tonumber(ARGV[3]) then
+        redis.call("HSET", KEYS[1], "tokens", tokens, "updated_at", now, "rate", rate, "decreased_at", decreased_at)
+        redis.call("EXPIRE", KEYS[1], 3600)
+        return {"-1", tostring(rate)}
+    end
+end
+
+redis.call("HSET", KEYS[1], "tokens", tokens - 1, "updated_at", now, "rate", rate, "decreased_at", decreased_at)
+redis.call("EXPIRE", KEYS[1], 3600)
+return {tostring(wait), tostring(rate)}
+"""
+
+class UpstreamThrottledError(Exception):
+    pass
+
+class AdaptiveRateLimiter:
+    def __init__(self):
+        self.initial_rate = settings.RATE_LIMIT_INITIAL_RATE
+        self.min_rate = settings.RATE_LIMIT_MIN_RATE
+        self.max_rate = settings.RATE_LIMIT_MAX_RATE
+        self.burst = settings.RATE_LIMIT_BURST
+        self.max_wait = settings.RATE_LIMIT_MAX_WAIT
+        self.increase_step = settings.RATE_LIMIT_INCREASE_STEP
+        self.decrease_factor = settings.RATE_LIMIT_DECREASE_FACTOR
+        self.decrease_cooldown = settings.RATE_LIMIT_DECREASE_COOLDOWN
+        self._acquire = async_redis_client.register_script(ACQUIRE_SCRIPT)
+        # 다음 acquire 때 함께 보낼 응답 결과 (호스트별 성공 수, 429/5xx 여부)
+        self._pending_successes: Dict[str, int] = defaultdict(int)
+        self._pending_throttled: Set[str] = set()
+
+    @staticmethod
+    def _key(host: str) -> str:
+        return f"rate_limit:{host}"
+
+    async def acquire(self, host: str):
+        successes = self._pending_successes.pop(host, 0)
+        throttled = host in self._pending_throttled
+        self._pending_throttled.discard(host)
+        try:
+            wait, rate = await self._acquire(keys=[self._key(host)], args=[
+                self.initial_rate,
+                self.burst,
+                self.max_wait,
+                successes,
+                int(throttled),
+                self.min_rate,
+                self.max_rate,
+                self.increase_step,
+                self.decrease_factor,
+                self.decrease_cooldown
+            ])
+        except Exception as e:
+            # Redis 장애 시 요청을 막지 않음
+            print(f"Rate limiter unavailable for {host}: {e}")
+            return
+
+        wait = float(wait)
+        RATE_LIMIT_RATE.labels(host=host).set(float(rate))
+        if wait < 0:
+            RATE_LIMIT_ACQUIRES.labels(host=host, outcome="rejected").inc()
+            raise UpstreamThrottledError(f"{host} rate limit queue is longer than {self.max_wait}s")
+
+        RATE_LIMIT_ACQUIRES.labels(host=host, outcome="queued" if wait > 0 else "immediate").inc()
+        RATE_LIMIT_WAIT.labels(host=host).observe(wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record(self, host: str, throttled: bool):
+        # Redis에는 바로 쓰지 않고 같은 호스트의 다음 acquire에 실어 보냄
+        if throttled:
+            UPSTREAM_THROTTLED_RESPONSES.labels(host=host).inc()
+            self._pending_throttled.add(host)
+        else:
+            self._pending_successes[host] += 1
+
+rate_limiter = AdaptiveRateLimiter()
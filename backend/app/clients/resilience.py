@@ -0,0 +1,163 @@
+import asyncio, functools, random, time
+from typing import Awaitable, Callable, Dict, TypeVar
+import httpx
+from app.core.config import settings
+from app.core.metrics import CIRCUIT_BREAKER_EVENTS, UPSTREAM_CALL_DURATION, UPSTREAM_HEDGES, UPSTREAM_RETRIES
+
+T = TypeVar("T")
+
+class CircuitOpenError(Exception):
+    pass
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = settings.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = settings.CIRCUIT_RESET_TIMEOUT
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed" # closed, open, half_open
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def before_call(self):
+        if self.state == "closed":
+            return
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = "half_open"
+        # half-open 상태에서는 한 요청만 보내 회복 여부를 확인
+        if self.state == "half_open" and not self._probing:
+            self._probing = True
+            return
+
+        CIRCUIT_BREAKER_EVENTS.labels(upstream=self.name, event="short_circuited").inc()
+        raise CircuitOpenError(f"{self.name} circuit is open")
+
+    def record_success(self):
+        self.state = "closed"
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._probing = False
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                CIRCUIT_BREAKER_EVENTS.labels(upstream=self.name, event="opened").inc()
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def release(self):
+        # 업스트림 상태와 무관하게 끝난 probe (404 등)
+        self._probing = False
+
+class RetryBudget:
+    def __init__(self, ratio: float = settings.UPSTREAM_RETRY_BUDGET_RATIO, max_tokens: float = settings.UPSTREAM_RETRY_BUDGET_MAX):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def deposit(self):
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+circuit_breakers: Dict[str, CircuitBreaker] = {}
+retry_budgets: Dict[str, RetryBudget] = {}
+
+def is_upstream_failure(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+def backoff_delay(attempt: int) -> float:
+    # full jitter
+    return random.uniform(0, min(settings.UPSTREAM_RETRY_MAX_DELAY, settings.UPSTREAM_RETRY_BASE_DELAY * 2 ** attempt))
+
+async def hedged(call: Callable[[], Awaitable[T]], delay: float, upstream: str) -> T:
+    tasks = [asyncio.create_task(call())]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done:
+            return tasks[0].result()
+
+        # 첫 요청이 delay 안에 끝나지 않으면 같은 요청을 하나 더 보내 먼저 온 응답을 사용
+        UPSTREAM_HEDGES.labels(upstream=upstream, outcome="sent").inc()
+        tasks.append(asyncio.create_task(call()))
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is tasks[1]:
+                        UPSTREAM_HEDGES.labels(upstream=upstream, outcome="won").inc()
+                    return task.result()
+        return tasks[0].result()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+def resilient(upstream: str, hedge: bool = False):
+    breaker = circuit_breakers.setdefault(upstream, CircuitBreaker(upstream))
+    budget = retry_budgets.setdefault(upstream, RetryBudget())
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            call = lambda: func(*args, **kwargs)
+            if hedge and settings.UPSTREAM_HEDGE_ENABLED:
+                call = lambda: hedged(lambda: func(*args, **kwargs), settings.UPSTREAM_HEDGE_DELAY, upstream)
+
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await call_with_retries(call)
+                outcome = "ok"
+                return result
+            except CircuitOpenError:
+                outcome = "short_circuited"
+                raise
+            finally:
+                UPSTREAM_CALL_DURATION.labels(upstream=upstream, method=func.__name__, outcome=outcome).observe(time.perf_counter() - started)
+
+        async def call_with_retries(call: Callable[[], Awaitable[T]]) -> T:
+            budget.deposit()
+            attempt = 0
+            while True:
+                breaker.before_call()
+                started = time.monotonic()
+                try:
+                    result = await call()
+                except asyncio.CancelledError:
+                    # 바깥 wait_for가 느린 호출을 끊은 경우는 업스트림 실패, 곧바로 끊긴 경우(클라이언트 이탈 등)는 무관
+                    if time.monotonic() - started >= settings.UPSTREAM_SLOW_CALL_SECONDS:
+                        breaker.record_failure()
+                    else:
+                        breaker.release()
+                    raise
+                except Exception as e:
+                    if not is_upstream_failure(e):
+                        breaker.release()
+                        raise
+                    breaker.record_failure()
+                    if attempt >= settings.UPSTREAM_RETRIES:
+                        raise
+                    if not budget.withdraw():
+                        UPSTREAM_RETRIES.labels(upstream=upstream, outcome="budget_exhausted").inc()
+                        raise
+                    UPSTREAM_RETRIES.labels(upstream=upstream, outcome="retried").inc()
+                    await asyncio.sleep(backoff_delay(attempt))
+                    attempt += 1
+                    continue
+                breaker.record_success()
+                return result
+        return wrapper
+    return decorator
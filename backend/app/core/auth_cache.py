@@ -0,0 +1,107 @@
+import asyncio, json, time
+from typing import Dict, Optional
+from jose import jwt
+from app.core.config import settings
+from app.core.redis import async_redis_client, BLACKLIST_CHANNEL, USER_INVALIDATE_CHANNEL
+from app.utils.cache import TTLCache
+
+token_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL)
+user_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL)
+
+def decode_token(token: str) -> dict:
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        # 토큰 만료 시각 이후로는 캐시하지 않음
+        ttl = min(settings.AUTH_CACHE_TTL, payload.get("exp", 0) - time.time())
+        if ttl > 0:
+            token_cache.set(token, payload, ttl=ttl)
+    return payload
+
+def token_id(token: str, payload: dict) -> str:
+    # jti가 없는 예전 토큰은 토큰 자체를 식별자로 사용
+    return payload.get("jti") or token
+
+def invalidate_user(user_id: str):
+    user_cache.pop(user_id)
+
+class LocalTokenBlacklist:
+    def __init__(self):
+        self.synced = False
+        self._expires_at: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, jti: str, expires_at: float):
+        self._expires_at[jti] = expires_at
+        if len(self._expires_at) % 1000 == 0:
+            self._prune()
+
+    def is_blacklisted(self, jti: str) -> Optional[bool]:
+        # 동기화되지 않았으면 판단하지 않고 Redis에 맡김
+        if not self.synced:
+            return None
+        expires_at = self._expires_at.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at < time.time():
+            del self._expires_at[jti]
+            return False
+        return True
+
+    def _prune(self):
+        now = time.time()
+        self._expires_at = {jti: expires_at for jti, expires_at in self._expires_at.items() if expires_at >= now}
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.synced = False
+
+    async def _load_snapshot(self):
+        keys = [key async for key in async_redis_client.scan_iter(match="blacklist:*", count=1000)]
+        now = time.time()
+        for start in range(0, len(keys), 1000):
+            batch = keys[start:start + 1000]
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                for key in batch:
+                    pipe.ttl(key)
+                ttls = await pipe.execute()
+            for key, ttl in zip(batch, ttls):
+                if ttl > 0:
+                    self._expires_at[key[len("blacklist:"):]] = now + ttl
+
+    async def _listen(self):
+        while True:
+            pubsub = async_redis_client.pubsub()
+            try:
+                await pubsub.subscribe(BLACKLIST_CHANNEL, USER_INVALIDATE_CHANNEL)
+                await self._load_snapshot()
+                self.synced = True
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    if message["channel"] == BLACKLIST_CHANNEL:
+                        event = json.loads(message["data"])
+                        self.add(event["jti"], event["expires_at"])
+                    elif message["channel"] == USER_INVALIDATE_CHANNEL:
+                        invalidate_user(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Token blacklist sync failed: {e}")
+            finally:
+                self.synced = False
+                await pubsub.close()
+            await asyncio.sleep(1)
+
+local_token_blacklist = LocalTokenBlacklist()
@@ -1,18 +1,108 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 class Settings(BaseSettings):
     DATABASE_URL: str
     REDIS_URL: str
+    REDIS_MAX_CONNECTIONS: int = 50
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    AUTH_CACHE_TTL: int = 60
+    AUTH_CACHE_SIZE: int = 10000
+
+    BCRYPT_ROUNDS: int = 12
+    HASH_WORKERS: int = 2
+    HASH_QUEUE_LIMIT: int = 32
 
     APP_NAME: str = "심밧다"
     VERSION: str = "1.0.0"
 
     DEBUG: bool = True
 
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 3600
+
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_TIMEOUT: float = 10.0
+    HTTP2_ENABLED: bool = False
+
+    JOONGNA_BUILD_ID_TTL: int = 60 * 60 * 6
+    JOONGNA_BUILD_ID_RECHECK_INTERVAL: float = 60.0 # 확인한 지 이 시간 안의 404는 상품 삭제 등으로 보고 build id를 다시 받지 않음
+
+    # 업스트림 호스트별 요청 속도 (초당 요청 수, 모든 워커 합산)
+    # 검색 한 페이지가 호스트마다 목록 1건 + 상세 최대 40건을 보내므로 burst는 캐시 없는 페이지 하나가 기다리지 않는 크기로 잡음
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_INITIAL_RATE: float = 25.0
+    RATE_LIMIT_MIN_RATE: float = 2.0
+    RATE_LIMIT_MAX_RATE: float = 100.0
+    RATE_LIMIT_BURST: int = 60
+    RATE_LIMIT_MAX_WAIT: float = 2.0 # DETAIL_FETCH_TIMEOUT보다 짧아야 대기 후 요청할 시간이 남음
+    RATE_LIMIT_INCREASE_STEP: float = 0.5
+    RATE_LIMIT_DECREASE_FACTOR: float = 0.5
+    RATE_LIMIT_DECREASE_COOLDOWN: float = 2.0
+
+    # 바깥 데드라인(PLATFORM_SEARCH_TIMEOUT, DETAIL_FETCH_TIMEOUT, AUTOCOMPLETE_TIMEOUT) 안에 재시도 한 번이 들어가도록 설정
+    UPSTREAM_TIMEOUTS: Dict[str, float] = {
+        "autocomplete": 0.8,
+        "search": 3.0,
+        "detail": 1.2,
+        "build_id": 2.0
+    }
+    UPSTREAM_RETRIES: int = 2
+    UPSTREAM_RETRY_BASE_DELAY: float = 0.1
+    UPSTREAM_RETRY_MAX_DELAY: float = 1.0
+    UPSTREAM_RETRY_BUDGET_RATIO: float = 0.2 # 요청 하나당 적립되는 재시도 토큰
+    UPSTREAM_RETRY_BUDGET_MAX: float = 10.0
+    UPSTREAM_SLOW_CALL_SECONDS: float = 0.8 # 이보다 오래 걸리다 취소된 호출은 바깥 타임아웃으로 보고 실패로 기록
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RESET_TIMEOUT: float = 30.0
+    UPSTREAM_HEDGE_ENABLED: bool = False
+    UPSTREAM_HEDGE_DELAY: float = 0.5
+
+    PLATFORM_SEARCH_TIMEOUT: float = 8.0
+    AUTOCOMPLETE_TIMEOUT: float = 2.0
+    BUNJANG_DETAIL_CONCURRENCY: int = 16
+    JOONGNA_DETAIL_CONCURRENCY: int = 8
+    DETAIL_FETCH_TIMEOUT: float = 3.0
+
+    DETAIL_CACHE_TTL: int = 60 * 60
+    DETAIL_CACHE_STALE_TTL: int = 60 * 60 * 24
+
+    SEARCH_PAGE_SIZE: int = 40
+
+    SEARCH_CACHE_TTL: int = 60
+    SEARCH_CACHE_LOCAL_TTL: float = 10.0
+    SEARCH_CACHE_LOCAL_SIZE: int = 256
+
+    AUTOCOMPLETE_INDEX_MAX_KEYWORDS: int = 50000
+    AUTOCOMPLETE_UPSTREAM_TTL: float = 60 * 30
+    AUTOCOMPLETE_SEARCH_WEIGHT: float = 3.0
+
+    PRICE_STATS_TTL: int = 60 * 60 * 24 * 7
+    PRICE_STATS_RELATIVE_ACCURACY: float = 0.01
+
+    ITEM_INDEX_FRESHNESS: int = 60 * 60 * 24
+
+    SAVED_SEARCH_ENABLED: bool = True
+    SAVED_SEARCH_POLL_INTERVAL: float = 60 * 5
+    SAVED_SEARCH_CONCURRENCY: int = 4
+    SAVED_SEARCH_MAX_MATCHES: int = 100
+    SAVED_SEARCH_MAX_PER_USER: int = 20
+    SAVED_SEARCH_SEEN_TTL: int = 60 * 60 * 24 * 30
+
+    LLM_TAGGING_ENABLED: bool = False
+    MODEL_PRELOAD: bool = False
+    INFERENCE_MAX_BATCH_SIZE: int = 8
+    INFERENCE_MAX_WAIT_MS: int = 20
+    TAG_STORE_REDIS_TTL: int = 60 * 60 * 24 * 7
+    TAG_STORE_LOCAL_TTL: float = 60 * 10
+    TAG_STORE_LOCAL_SIZE: int = 4096
+
     ALLOWED_ORIGINS: List[str] = [
         "http://localhost:3000",
         "http://localhost:8080",
@@ -0,0 +1,47 @@
+import asyncio, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_and_update_password
+
+class HashingBusyError(Exception):
+    pass
+
+class PasswordHasher:
+    def __init__(self, workers: int = settings.HASH_WORKERS, queue_limit: int = settings.HASH_QUEUE_LIMIT):
+        self.workers = workers
+        self.max_pending = workers + queue_limit
+        self._pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _submit(self, func, *args):
+        # 대기열이 가득 차면 기다리지 않고 바로 거절
+        if self._pending >= self.max_pending:
+            raise HashingBusyError("Password hashing queue is full")
+
+        self.start()
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(get_password_hash, password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        return await self._submit(verify_and_update_password, plain_password, hashed_password)
+
+password_hasher = PasswordHasher()
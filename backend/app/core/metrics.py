@@ -0,0 +1,128 @@
+import os, time
+from contextlib import contextmanager
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+
+# 여러 uvicorn 워커의 값을 합치려면 서버 시작 전에 PROMETHEUS_MULTIPROC_DIR 환경 변수를 설정해야 함
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS
+)
+UPSTREAM_CALL_DURATION = Histogram(
+    "upstream_call_duration_seconds",
+    "Upstream client method latency, including retries",
+    ["upstream", "method", "outcome"],
+    buckets=LATENCY_BUCKETS
+)
+SEARCH_STAGE_DURATION = Histogram(
+    "search_stage_duration_seconds",
+    "SearchService stage latency",
+    ["stage", "platform"],
+    buckets=LATENCY_BUCKETS
+)
+EXAONE_GENERATE_DURATION = Histogram(
+    "exaone_generate_duration_seconds",
+    "Exaone generate call latency",
+    ["batch_size"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+EXAONE_TOKENS_PER_SECOND = Histogram(
+    "exaone_generated_tokens_per_second",
+    "Generated tokens per second for each Exaone generate call",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+)
+EXAONE_GENERATED_TOKENS = Counter(
+    "exaone_generated_tokens",
+    "Tokens generated by Exaone"
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database pool connection",
+    ["engine"],
+    buckets=FAST_BUCKETS
+)
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Redis command and pipeline latency",
+    ["command"],
+    buckets=FAST_BUCKETS
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups",
+    "Cache lookups by cache and outcome",
+    ["cache", "outcome"]
+)
+RATE_LIMIT_ACQUIRES = Counter(
+    "rate_limit_acquires",
+    "Upstream rate limiter acquires by outcome (immediate, queued, rejected)",
+    ["host", "outcome"]
+)
+RATE_LIMIT_WAIT = Histogram(
+    "rate_limit_wait_seconds",
+    "Time a request waited for its reserved rate limiter slot",
+    ["host"],
+    buckets=(0.0, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
+)
+# 속도는 Redis에서 워커끼리 공유하는 값이므로 가장 최근에 본 값을 씀
+RATE_LIMIT_RATE = Gauge(
+    "rate_limit_rate",
+    "Current shared request rate per upstream host (req/s)",
+    ["host"],
+    multiprocess_mode="mostrecent"
+)
+UPSTREAM_THROTTLED_RESPONSES = Counter(
+    "upstream_throttled_responses",
+    "Upstream 429, 5xx and timeout responses that lowered the rate",
+    ["host"]
+)
+UPSTREAM_RETRIES = Counter(
+    "upstream_retries",
+    "Upstream retry decisions (retried, budget_exhausted)",
+    ["upstream", "outcome"]
+)
+CIRCUIT_BREAKER_EVENTS = Counter(
+    "circuit_breaker_events",
+    "Circuit breaker transitions and rejected calls (opened, short_circuited)",
+    ["upstream", "event"]
+)
+UPSTREAM_HEDGES = Counter(
+    "upstream_hedges",
+    "Hedged upstream requests (sent, won)",
+    ["upstream", "outcome"]
+)
+UPSTREAM_PARSE_BYTES = Counter(
+    "upstream_parse_bytes",
+    "Bytes of upstream JSON decoded",
+    ["source"]
+)
+UPSTREAM_PARSE_DURATION = Histogram(
+    "upstream_parse_duration_seconds",
+    "Upstream JSON decode time",
+    ["source"],
+    buckets=FAST_BUCKETS
+)
+
+@contextmanager
+def observe(histogram: Histogram, **labels):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.labels(**labels).observe(time.perf_counter() - started)
+
+def render_metrics() -> bytes:
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+def mark_process_dead():
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
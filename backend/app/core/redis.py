@@ -1,23 +1,70 @@
-import redis
-from datetime import timedelta
+import json, time
+import redis.asyncio as aioredis
+from typing import Any, List, Optional
 from app.core.config import settings
+from app.core.metrics import REDIS_COMMAND_DURATION
 
-redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+BLACKLIST_CHANNEL = "events:blacklist"
+USER_INVALIDATE_CHANNEL = "events:user_invalidate"
+
+redis_pool = aioredis.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+    max_connections=settings.REDIS_MAX_CONNECTIONS
+)
+class TimedPipeline(aioredis.client.Pipeline):
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        started = time.perf_counter()
+        try:
+            return await super().execute(raise_on_error)
+        finally:
+            REDIS_COMMAND_DURATION.labels(command="PIPELINE").observe(time.perf_counter() - started)
+
+class TimedRedis(aioredis.Redis):
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_DURATION.labels(command=str(args[0]).upper()).observe(time.perf_counter() - started)
+
+    def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None) -> TimedPipeline:
+        return TimedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
+async_redis_client = TimedRedis(connection_pool=redis_pool)
 
 class RedisTokenBlacklist:
     @staticmethod
-    def add_token(token: str, expire_minutes: int = 30):
-        redis_client.setex(f"blacklist:{token}", timedelta(minutes=expire_minutes), "blacklisted")
+    async def add_token(jti: str, expires_at: float):
+        ttl = int(expires_at - time.time())
+        if ttl <= 0:
+            return
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            pipe.setex(f"blacklist:{jti}", ttl, "1")
+            pipe.publish(BLACKLIST_CHANNEL, json.dumps({"jti": jti, "expires_at": expires_at}))
+            await pipe.execute()
 
     @staticmethod
-    def is_blacklisted(token: str) -> bool:
-        return redis_client.exists(f"blacklist:{token}") > 0
+    async def is_blacklisted(jti: str) -> bool:
+        return await async_redis_client.exists(f"blacklist:{jti}") > 0
 
-def redis_connection():
+async def get_json_many(keys: List[str]) -> List[Optional[Any]]:
+    if not keys:
+        return []
+    values = await async_redis_client.mget(keys)
+    return [json.loads(value) if value else None for value in values]
+
+async def publish_user_invalidation(user_id: str):
+    await async_redis_client.publish(USER_INVALIDATE_CHANNEL, user_id)
+
+async def redis_connection():
     try:
-        redis_client.ping()
+        await async_redis_client.ping()
         print("Redis connection successful!")
         return True
     except Exception as e:
         print(f"Redis connection failed: {e}")
         return False
+
+async def close_redis():
+    await redis_pool.disconnect()
@@ -1,5 +1,6 @@
-from transformers import AutoModelForCausalLM, AutoTokenizer
+import time
 from typing import List, Dict
+from app.core.metrics import EXAONE_GENERATE_DURATION, EXAONE_GENERATED_TOKENS, EXAONE_TOKENS_PER_SECOND
 
 class Exaone:
     def __init__(self):
@@ -19,7 +20,16 @@ class Exaone:
             self._load_tokenizer()
         return self._tokenizer
 
+    def load(self):
+        if self._model is None:
+            self._load_model()
+        if self._tokenizer is None:
+            self._load_tokenizer()
+
     def _load_model(self):
+        # transformers/torch는 무거워서 실제로 모델을 올릴 때만 import
+        from transformers import AutoModelForCausalLM
+
         try:
             self._model = AutoModelForCausalLM.from_pretrained(
                 self.model_name,
@@ -30,6 +40,8 @@ class Exaone:
             raise RuntimeError(f"Model loading failed: {e}")
 
     def _load_tokenizer(self):
+        from transformers import AutoTokenizer
+
         try:
             self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
         except Exception as e:
@@ -42,6 +54,7 @@ class Exaone:
         try:
             input_ids = self._tokenize_messages(messages)
 
+            started = time.perf_counter()
             output = self.model.generate(
                 input_ids.to(self.model.device),
                 max_new_tokens=max_length,
@@ -49,12 +62,66 @@ class Exaone:
                 temperature=0.7,
                 top_p=0.95
             )
+            self._record_generation(started, output.shape[1] - input_ids.shape[1], 1)
 
             return self.tokenizer.decode(output[0])
 
         except Exception as e:
             raise RuntimeError(f"Text generation failed: {e}")
 
+    def generate_batch(self, batch: List[List[Dict[str, str]]], max_length: int = 100) -> List[str]:
+        if not batch:
+            return []
+
+        try:
+            inputs = self._tokenize_batch(batch).to(self.model.device)
+
+            started = time.perf_counter()
+            output = self.model.generate(
+                **inputs,
+                max_new_tokens=max_length,
+                do_sample=True,
+                temperature=0.7,
+                top_p=0.95,
+                pad_token_id=self.tokenizer.pad_token_id
+            )
+
+            prompt_length = inputs["input_ids"].shape[1]
+            generated = output[:, prompt_length:]
+            self._record_generation(started, int((generated != self.tokenizer.pad_token_id).sum()), len(batch))
+            return self.tokenizer.batch_decode(generated, skip_special_tokens=True)
+
+        except Exception as e:
+            raise RuntimeError(f"Batch text generation failed: {e}")
+
+    @staticmethod
+    def _record_generation(started: float, generated_tokens: int, batch_size: int):
+        elapsed = time.perf_counter() - started
+        EXAONE_GENERATE_DURATION.labels(batch_size=str(batch_size)).observe(elapsed)
+        EXAONE_GENERATED_TOKENS.inc(generated_tokens)
+        if elapsed > 0:
+            EXAONE_TOKENS_PER_SECOND.observe(generated_tokens / elapsed)
+
+    def _tokenize_batch(self, batch: List[List[Dict[str, str]]]):
+        try:
+            prompts = [
+                self.tokenizer.apply_chat_template(
+                    messages,
+                    tokenize=False,
+                    add_generation_prompt=True,
+                    enable_thinking=False # 태그 생성에는 추론 과정이 필요 없음
+                )
+                for messages in batch
+            ]
+        except Exception as e:
+            raise ValueError(f"Invalid message format: {e}")
+
+        # 디코더 모델은 왼쪽 패딩이어야 생성 위치가 맞음
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        return self.tokenizer(prompts, return_tensors="pt", padding=True)
+
     def _tokenize_messages(self, messages: List[Dict[str, str]]):
         try:
             return self.tokenizer.apply_chat_template(
@@ -62,7 +129,7 @@ class Exaone:
                 tokenize=True,
                 add_generation_prompt=True,
                 return_tensors="pt",
-                enable_thinking=True
+                enable_thinking=False
             )
         except Exception as e:
             raise ValueError(f"Invalid message format: {e}")
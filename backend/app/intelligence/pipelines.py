@@ -1,8 +1,48 @@
+import asyncio, time
+from typing import Optional
 from ._exaone import Exaone
+from .worker import InferenceWorker
 
 class ExaonePipeline:
+    PROMPT_VERSION = "1" # 프롬프트를 바꾸면 올려서 저장된 태그를 무효화
     def __init__(self):
         self.exaone = Exaone()
+        self.worker = InferenceWorker(self.exaone)
+        self.state = "not_loaded" # not_loaded, loading, warming, ready, failed
+        self._loading: Optional[asyncio.Future] = None
+
+    async def load(self):
+        # warmup과 첫 태그 생성(지연 로딩) 모두 여기서 모델을 올리고 예열한 뒤 state를 갱신
+        if self.state == "ready":
+            return
+        if self._loading is None or self.state == "failed":
+            self.state = "loading"
+            self._loading = asyncio.ensure_future(self._load())
+        await asyncio.shield(self._loading)
+
+    async def _load(self):
+        started = time.perf_counter()
+        try:
+            await self.worker.run(self.exaone.load)
+            print(f"Model loaded in {time.perf_counter() - started:.2f}s")
+            # 첫 생성이 끝나야 실제 요청을 바로 처리할 수 있으므로 그때 ready로 전환
+            self.state = "warming"
+            await self.worker.run(
+                self.exaone.generate_batch,
+                [[{"role": "user", "content": "안녕"}]],
+                1
+            )
+        except Exception:
+            self.state = "failed"
+            raise
+        self.state = "ready"
+        print(f"Model warmup finished in {time.perf_counter() - started:.2f}s")
+
+    async def warmup(self):
+        try:
+            await self.load()
+        except Exception as e:
+            print(f"Model warmup failed: {e}")
 
     async def generate_tag(self, item_data: dict[str, str]) -> list[str]:
         prompt = f"""
@@ -15,9 +55,13 @@ class ExaonePipeline:
         ex) 직거래, 택배, 편의점 택배 가능, 사용감 적음, 트레이닝 복
         """
 
-        response = self.exaone.generate(
+        await self.load()
+        response = await self.worker.submit(
             messages=[
                 {"role":"user", "content":prompt}
             ]
         )
-        return [tag.strip() for tag in response.split(",")]
+        return [tag.strip() for tag in response.split(",") if tag.strip()]
+
+    async def close(self):
+        await self.worker.stop()
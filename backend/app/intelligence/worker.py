@@ -0,0 +1,101 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
+
+class InferenceWorker:
+    def __init__(
+        self,
+        exaone,
+        max_batch_size: int = settings.INFERENCE_MAX_BATCH_SIZE,
+        max_wait_ms: int = settings.INFERENCE_MAX_WAIT_MS,
+        max_length: int = 100
+    ):
+        self.exaone = exaone
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_length = max_length
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch: List[Tuple[List[Dict[str, str]], asyncio.Future]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        # 모델 호출은 항상 전용 스레드 하나에서만 실행, stop() 뒤 다시 쓰이면 새로 만듦
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="exaone")
+        return self._executor
+
+    def start(self):
+        self._ensure_executor()
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        # 큐에 남은 요청과 처리 중이던 배치의 호출자가 영원히 기다리지 않도록 모두 실패 처리
+        pending, self._batch = self._batch, []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Inference worker stopped"))
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._ensure_executor(), func, *args)
+
+    async def submit(self, messages: List[Dict[str, str]]) -> str:
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((messages, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[List[Dict[str, str]], asyncio.Future]]:
+        loop = asyncio.get_running_loop()
+        self._batch = batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return [(messages, future) for messages, future in batch if not future.cancelled()]
+
+    async def _run(self):
+        while True:
+            batch = await self._collect_batch()
+            if not batch:
+                continue
+
+            try:
+                outputs = await self.run(
+                    self.exaone.generate_batch,
+                    [messages for messages, _ in batch],
+                    self.max_length
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), output in zip(batch, outputs):
+                if not future.done():
+                    future.set_result(output)
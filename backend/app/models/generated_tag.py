@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy.sql import func
+from app.database import Base
+
+class GeneratedTag(Base):
+    __tablename__ = "generated_tags"
+
+    content_hash = Column(String(64), primary_key=True) # sha256(매물 정보 + 모델 + 프롬프트 버전)
+    model_name = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    tags = Column(JSON, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
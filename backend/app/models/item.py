@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+
+class Item(Base):
+    __tablename__ = "items"
+
+    platform = Column(String, primary_key=True) # joongna or bunjang
+    item_id = Column(String, primary_key=True)
+    name = Column(String, nullable=False)
+    price = Column(Integer, nullable=False)
+    thumbnail = Column(String, nullable=False)
+    tags = Column(JSONB, nullable=False, server_default="[]")
+    seen_at = Column(DateTime, nullable=False, server_default=func.now(), index=True) # 마지막으로 검색 결과에 나온 시각
+
+    __table_args__ = (
+        # pg_trgm 확장 필요 (부분 일치 ILIKE와 유사도 정렬용)
+        Index("ix_items_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("ix_items_name_fts", text("to_tsvector('simple', name)"), postgresql_using="gin"),
+    )
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.database import Base
+
+class SavedSearch(Base):
+    __tablename__ = "saved_searches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    query = Column(String, nullable=False)
+    normalized_query = Column(String, nullable=False, index=True) # 스케줄러가 같은 검색어끼리 묶는 기준
+    platform = Column(String, nullable=False, default="all") # bunjang, joongna or all
+    min_price = Column(Integer, nullable=True)
+    max_price = Column(Integer, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import Dict, List, Optional
 
 class GetAutocompleteResponse(BaseModel):
     keywords: List[str]
@@ -13,8 +13,34 @@ class ItemDetail(BaseModel):
     thumbnail: str
     tags: List[str]
 
+class PlatformStatus(BaseModel):
+    platform: str
+    status: str # ok, timeout, error
+    item_count: int = 0
+    elapsed_ms: int = 0
+    error: Optional[str] = None
+
 class ItemSearchResponse(BaseModel):
     items: List[ItemDetail]
     item_count: int
     query: str
     platform: str
+    platforms: List[PlatformStatus] = []
+    next_cursor: Optional[str] = None
+
+class PriceBucket(BaseModel):
+    lower: int
+    upper: int
+    count: int
+
+class PlatformPriceStats(BaseModel):
+    platform: str # bunjang, joongna, all
+    count: int
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+    quantiles: Dict[str, int] = {} # p10, p25, p50, p75, p90
+    histogram: List[PriceBucket] = []
+
+class PriceStatsResponse(BaseModel):
+    query: str
+    platforms: List[PlatformPriceStats]
@@ -0,0 +1,29 @@
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from app.schemas.item import ItemDetail
+
+class SavedSearchCreate(BaseModel):
+    query: str = Field(..., min_length=1, max_length=100)
+    platform: str = Field("all", pattern="^(bunjang|joongna|all)$")
+    min_price: Optional[int] = Field(None, ge=0)
+    max_price: Optional[int] = Field(None, ge=0)
+
+class SavedSearchResponse(BaseModel):
+    id: int
+    query: str
+    platform: str
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class SavedSearchMatch(ItemDetail):
+    found_at: float
+
+class SavedSearchMatchesResponse(BaseModel):
+    saved_search_id: int
+    items: List[SavedSearchMatch]
+    item_count: int
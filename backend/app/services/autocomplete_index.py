@@ -0,0 +1,45 @@
+import bisect, heapq
+from typing import Dict, List
+from app.core.config import settings
+from app.utils.text import normalize_query
+
+class AutocompleteIndex:
+    def __init__(self, max_keywords: int = settings.AUTOCOMPLETE_INDEX_MAX_KEYWORDS):
+        self.max_keywords = max_keywords
+        self._keys: List[str] = []
+        self._keywords: Dict[str, str] = {}
+        self._scores: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, keyword: str, weight: float = 1.0):
+        key = normalize_query(keyword)
+        if not key:
+            return
+
+        if key not in self._scores:
+            bisect.insort(self._keys, key)
+            self._keywords[key] = keyword.strip()
+            self._scores[key] = 0.0
+        self._scores[key] += weight
+
+        if len(self._keys) > self.max_keywords:
+            self._prune()
+
+    def lookup(self, prefix: str, limit: int = 10) -> List[str]:
+        prefix = normalize_query(prefix)
+        start = bisect.bisect_left(self._keys, prefix)
+        end = bisect.bisect_left(self._keys, prefix + "\U0010ffff", lo=start)
+
+        keys = heapq.nlargest(limit, self._keys[start:end], key=self._scores.__getitem__)
+        return [self._keywords[key] for key in keys]
+
+    def _prune(self):
+        # 점수가 낮은 하위 10%를 정리
+        keep = heapq.nlargest(int(self.max_keywords * 0.9), self._keys, key=self._scores.__getitem__)
+        self._keys = sorted(keep)
+        self._keywords = {key: self._keywords[key] for key in self._keys}
+        self._scores = {key: self._scores[key] for key in self._keys}
+
+autocomplete_index = AutocompleteIndex()
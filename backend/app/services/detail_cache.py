@@ -0,0 +1,89 @@
+import asyncio, json, time
+from typing import Awaitable, Callable, Dict, List, Optional
+from app.core.config import settings
+from app.core.metrics import CACHE_LOOKUPS
+from app.core.redis import async_redis_client, get_json_many
+
+DETAIL_FIELDS = ("title", "description", "category", "item_tags")
+
+class ItemDetailCache:
+    def __init__(self, ttl: int = settings.DETAIL_CACHE_TTL, stale_ttl: int = settings.DETAIL_CACHE_STALE_TTL):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def _key(platform: str, item_id: str) -> str:
+        return f"item_detail:{platform}:{item_id}"
+
+    async def load_many(self, platform: str, item_ids: List[str]) -> Dict[str, dict]:
+        try:
+            entries = await get_json_many([self._key(platform, item_id) for item_id in item_ids])
+        except Exception as e:
+            CACHE_LOOKUPS.labels(cache="item_detail", outcome="error").inc()
+            print(f"Detail cache read failed: {e}")
+            return {}
+        return {item_id: entry for item_id, entry in zip(item_ids, entries) if entry is not None}
+
+    async def get_or_fetch(
+        self,
+        platform: str,
+        item_id: str,
+        fetch: Callable[[], Awaitable[Dict[str, str]]],
+        cached: Optional[dict] = None
+    ) -> Dict[str, str]:
+        key = self._key(platform, item_id)
+        if cached is None:
+            cached = await self._load(key)
+
+        if cached is None:
+            CACHE_LOOKUPS.labels(cache="item_detail", outcome="miss").inc()
+            item_data = await fetch()
+            await self._store(key, item_data)
+            return item_data
+
+        if time.time() - cached["fetched_at"] > self.ttl:
+            CACHE_LOOKUPS.labels(cache="item_detail", outcome="stale").inc()
+            self._schedule_refresh(key, fetch)
+        else:
+            CACHE_LOOKUPS.labels(cache="item_detail", outcome="hit").inc()
+        return cached["data"]
+
+    async def _load(self, key: str) -> Optional[dict]:
+        try:
+            raw = await async_redis_client.get(key)
+        except Exception as e:
+            CACHE_LOOKUPS.labels(cache="item_detail", outcome="error").inc()
+            print(f"Detail cache read failed: {e}")
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _store(self, key: str, item_data: Dict[str, str]):
+        value = {
+            "fetched_at": time.time(),
+            "data": {field: item_data[field] for field in DETAIL_FIELDS}
+        }
+        try:
+            await async_redis_client.set(key, json.dumps(value, ensure_ascii=False), ex=self.ttl + self.stale_ttl)
+        except Exception as e:
+            CACHE_LOOKUPS.labels(cache="item_detail", outcome="error").inc()
+            print(f"Detail cache write failed: {e}")
+
+    def _schedule_refresh(self, key: str, fetch: Callable[[], Awaitable[Dict[str, str]]]):
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                # 다른 워커가 이미 갱신 중이면 건너뜀
+                if not await async_redis_client.set(f"{key}:refresh", "1", nx=True, ex=30):
+                    return
+                await self._store(key, await fetch())
+            except Exception as e:
+                print(f"Detail cache refresh failed for {key}: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+detail_cache = ItemDetailCache()
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import timedelta
+from typing import List, Optional, Set
+from sqlalchemy import and_, func, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from app.core.config import settings
+from app.database import AsyncSessionLocal
+from app.models.item import Item
+from app.services.records import ItemRecord
+
+# 인덱스 식과 같아야 하므로 바인드 파라미터가 아닌 상수로 넣음
+TS_CONFIG = literal_column("'simple'::regconfig")
+
+class ItemIndexUnavailableError(Exception):
+    pass
+
+class ItemIndex:
+    def __init__(self, freshness: int = settings.ITEM_INDEX_FRESHNESS):
+        self.freshness = freshness
+        self._writes: Set[asyncio.Task] = set()
+
+    def upsert_later(self, items: List[ItemRecord]):
+        # 검색 응답이 DB 쓰기를 기다리지 않도록 백그라운드에서 저장함 (실패는 upsert가 로그로 남김)
+        if not items:
+            return
+        task = asyncio.create_task(self.upsert(items))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def close(self):
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+
+    async def upsert(self, items: List[ItemRecord]):
+        if not items:
+            return
+
+        # 한 검색 결과 안에 같은 매물이 두 번 나오면 ON CONFLICT가 실패하므로 먼저 합침
+        rows = {
+            (item.platform, item.item_id): {
+                "platform": item.platform,
+                "item_id": item.item_id,
+                "name": item.name,
+                "price": item.price,
+                "thumbnail": item.thumbnail,
+                "tags": item.tags,
+                "seen_at": func.now()
+            }
+            for item in items
+        }
+        statement = insert(Item).values(list(rows.values()))
+        statement = statement.on_conflict_do_update(
+            index_elements=[Item.platform, Item.item_id],
+            set_={
+                "name": statement.excluded.name,
+                "price": statement.excluded.price,
+                "thumbnail": statement.excluded.thumbnail,
+                # 태그 조회에 실패한 결과로 기존 태그를 지우지 않음
+                "tags": func.coalesce(func.nullif(statement.excluded.tags, literal_column("'[]'::jsonb")), Item.tags),
+                "seen_at": statement.excluded.seen_at
+            }
+        )
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(statement)
+                await db.commit()
+        except Exception as e:
+            print(f"Item index write failed: {e}")
+
+    async def search(
+        self,
+        query: str,
+        platforms: List[str],
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        sort: str = "relevance",
+        offset: int = 0,
+        limit: int = settings.SEARCH_PAGE_SIZE
+    ) -> List[ItemRecord]:
+        query = " ".join(query.split())
+        tokens = query.split()
+
+        conditions = [
+            Item.platform.in_(platforms),
+            Item.seen_at >= func.now() - timedelta(seconds=self.freshness),
+            or_(
+                func.to_tsvector(TS_CONFIG, Item.name).op("@@")(func.plainto_tsquery(TS_CONFIG, query)),
+                and_(*(Item.name.ilike(f"%{self._escape_like(token)}%", escape="\\") for token in tokens))
+            )
+        ]
+        if min_price:
+            conditions.append(Item.price >= min_price)
+        if max_price:
+            conditions.append(Item.price <= max_price)
+
+        if sort == "price_asc":
+            order_by = (Item.price.asc(), Item.seen_at.desc())
+        elif sort == "price_desc":
+            order_by = (Item.price.desc(), Item.seen_at.desc())
+        else:
+            order_by = (func.similarity(Item.name, query).desc(), Item.seen_at.desc())
+
+        statement = (
+            select(Item)
+            .where(*conditions)
+            .order_by(*order_by, Item.platform, Item.item_id)
+            .offset(offset)
+            .limit(limit)
+        )
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(statement)
+                rows = result.scalars().all()
+        except Exception as e:
+            raise ItemIndexUnavailableError(f"Item index read failed: {e}") from e
+
+        return [ItemRecord(row.item_id, row.platform, row.name, row.price, row.thumbnail, list(row.tags)) for row in rows]
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+item_index = ItemIndex()
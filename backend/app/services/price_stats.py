@@ -0,0 +1,140 @@
+import math
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from app.core.config import settings
+from app.core.redis import async_redis_client
+from app.utils.text import normalize_query
+from app.services.records import ItemRecord
+
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+# 처음 보는 item_id만 버킷에 더하고 min/max를 갱신함 (워커 간 중복 집계 방지)
+RECORD_SCRIPT = """
+local added = 0
+for i = 2, #ARGV, 3 do
+    if redis.call("SADD", KEYS[1], ARGV[i]) == 1 then
+        redis.call("HINCRBY", KEYS[2], ARGV[i + 1], 1)
+        local price = tonumber(ARGV[i + 2])
+        local low = tonumber(redis.call("HGET", KEYS[2], "min"))
+        if not low or price < low then
+            redis.call("HSET", KEYS[2], "min", price)
+        end
+        local high = tonumber(redis.call("HGET", KEYS[2], "max"))
+        if not high or price > high then
+            redis.call("HSET", KEYS[2], "max", price)
+        end
+        added = added + 1
+    end
+end
+redis.call("EXPIRE", KEYS[1], ARGV[1])
+redis.call("EXPIRE", KEYS[2], ARGV[1])
+return added
+"""
+
+@dataclass(slots=True)
+class PriceSketch:
+    gamma: float
+    counts: Dict[int, int] = field(default_factory=dict)
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts.values())
+
+    def merge(self, other: "PriceSketch") -> "PriceSketch":
+        counts = dict(self.counts)
+        for index, count in other.counts.items():
+            counts[index] = counts.get(index, 0) + count
+        prices = [price for price in (self.min_price, self.max_price, other.min_price, other.max_price) if price is not None]
+        return PriceSketch(
+            self.gamma,
+            counts,
+            min(prices) if prices else None,
+            max(prices) if prices else None
+        )
+
+    def summarize(self, bins: int) -> dict:
+        if not self.counts:
+            return {"count": 0, "min_price": None, "max_price": None, "quantiles": {}, "histogram": []}
+
+        indices = np.array(sorted(self.counts), dtype=np.float64)
+        counts = np.array([self.counts[int(index)] for index in indices], dtype=np.int64)
+        # 버킷 (gamma^(i-1), gamma^i]의 대표값, 실제 min/max 밖으로 나가지 않게 자름
+        values = np.clip(2 * self.gamma ** indices / (self.gamma + 1), self.min_price, self.max_price)
+        cumulative = np.cumsum(counts)
+        total = int(cumulative[-1])
+
+        positions = np.searchsorted(cumulative, [q * (total - 1) for q in QUANTILES], side="right")
+        quantiles = {f"p{round(q * 100)}": int(round(values[position])) for q, position in zip(QUANTILES, positions)}
+
+        if self.min_price == self.max_price:
+            edges = np.array([self.min_price, self.max_price], dtype=np.float64)
+            histogram = np.array([total])
+        else:
+            histogram, edges = np.histogram(values, bins=bins, range=(self.min_price, self.max_price), weights=counts)
+
+        return {
+            "count": total,
+            "min_price": self.min_price,
+            "max_price": self.max_price,
+            "quantiles": quantiles,
+            "histogram": [
+                {"lower": int(edges[i]), "upper": int(edges[i + 1]), "count": int(histogram[i])}
+                for i in range(len(histogram))
+            ]
+        }
+
+class PriceStatsStore:
+    def __init__(self, ttl: int = settings.PRICE_STATS_TTL, relative_accuracy: float = settings.PRICE_STATS_RELATIVE_ACCURACY):
+        self.ttl = ttl
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._record = async_redis_client.register_script(RECORD_SCRIPT)
+
+    @staticmethod
+    def _key(platform: str, query: str) -> str:
+        return f"price_stats:{platform}:{normalize_query(query)}"
+
+    def bucket(self, price: int) -> int:
+        return math.ceil(math.log(price) / self._log_gamma)
+
+    async def record(self, platform: str, query: str, items: List[ItemRecord]):
+        args = [self.ttl]
+        for item in items:
+            # 가격 미정(0원) 매물은 시세에서 제외
+            if item.price > 0:
+                args += [item.item_id, f"b{self.bucket(item.price)}", item.price]
+        if len(args) == 1:
+            return
+
+        key = self._key(platform, query)
+        try:
+            await self._record(keys=[f"{key}:seen", key], args=args)
+        except Exception as e:
+            print(f"Price stats write failed: {e}")
+
+    async def load(self, query: str, platforms: List[str]) -> Dict[str, PriceSketch]:
+        try:
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                for platform in platforms:
+                    pipe.hgetall(self._key(platform, query))
+                entries = await pipe.execute()
+        except Exception as e:
+            print(f"Price stats read failed: {e}")
+            entries = [{} for _ in platforms]
+
+        sketches = {}
+        for platform, entry in zip(platforms, entries):
+            sketch = PriceSketch(self.gamma)
+            for name, value in entry.items():
+                if name.startswith("b"):
+                    sketch.counts[int(name[1:])] = int(value)
+            if sketch.counts:
+                sketch.min_price = int(entry["min"])
+                sketch.max_price = int(entry["max"])
+            sketches[platform] = sketch
+        return sketches
+
+price_stats = PriceStatsStore()
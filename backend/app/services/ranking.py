@@ -0,0 +1,111 @@
+import re, unicodedata, zlib
+import numpy as np
+from typing import List
+from app.services.records import ItemRecord
+
+SORT_MODES = ("relevance", "price_asc", "price_desc")
+FEATURE_DIM = 256
+DUPLICATE_SIMILARITY = 0.85
+DUPLICATE_PRICE_RATIO = 0.1
+
+TAG_WEIGHTS = {
+    "새상품": 1.0,
+    "사용감 없음": 0.8,
+    "사용감 적음": 0.4,
+    "무료배송": 0.5,
+    "직거래": 0.1,
+    "사용감 많음": -0.4,
+    "고장/파손 상품": -1.0
+}
+
+SCORE_WEIGHTS = {
+    "relevance": 0.6,
+    "price": 0.25,
+    "tags": 0.15
+}
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+def normalize_title(title: str) -> str:
+    title = unicodedata.normalize("NFKC", title).casefold()
+    return " ".join(_NON_WORD.sub(" ", title).split())
+
+def trigram_features(texts: List[str]) -> np.ndarray:
+    rows, cols = [], []
+    for row, text in enumerate(texts):
+        # 띄어쓰기만 다른 제목이 같게 보이도록 공백을 제거하고 trigram을 뽑음
+        padded = f" {text.replace(' ', '')} "
+        for i in range(len(padded) - 2):
+            rows.append(row)
+            # 내장 hash()는 프로세스마다 salt가 달라 워커마다 다른 벡터가 나오므로 crc32를 씀
+            cols.append(zlib.crc32(padded[i:i + 3].encode()) % FEATURE_DIM)
+
+    flat = np.array(rows, dtype=np.intp) * FEATURE_DIM + np.array(cols, dtype=np.intp)
+    features = np.bincount(flat, minlength=len(texts) * FEATURE_DIM).astype(np.float32).reshape(len(texts), FEATURE_DIM)
+    norms = np.linalg.norm(features, axis=1, keepdims=True)
+    return features / np.maximum(norms, 1e-6)
+
+def find_cross_platform_duplicates(features: np.ndarray, prices: np.ndarray, platforms: np.ndarray) -> np.ndarray:
+    dropped = np.zeros(len(prices), dtype=bool)
+    names = np.unique(platforms)
+
+    for i, left_name in enumerate(names):
+        for right_name in names[i + 1:]:
+            left = np.flatnonzero(platforms == left_name)
+            right = np.flatnonzero(platforms == right_name)
+
+            # 왼쪽 매물마다 가장 비슷한 오른쪽 매물 하나만 후보로 봄
+            similarity = features[left] @ features[right].T
+            best = similarity.argmax(axis=1)
+            best_similarity = similarity[np.arange(len(left)), best]
+            left_prices, right_prices = prices[left], prices[right][best]
+            price_gap = np.abs(left_prices - right_prices) / np.maximum(np.maximum(left_prices, right_prices), 1.0)
+            candidates = np.flatnonzero((best_similarity >= DUPLICATE_SIMILARITY) & (price_gap <= DUPLICATE_PRICE_RATIO))
+
+            # 가장 비슷한 쌍부터 보고, 같은 상품이면 더 비싼 쪽을 뺌
+            for left_index in candidates[np.argsort(-best_similarity[candidates], kind="stable")]:
+                a, b = left[left_index], right[best[left_index]]
+                if dropped[a] or dropped[b]:
+                    continue
+                dropped[b if prices[b] >= prices[a] else a] = True
+    return dropped
+
+def score_items(items: List[ItemRecord], query: str, features: np.ndarray, prices: np.ndarray) -> np.ndarray:
+    relevance = features @ trigram_features([normalize_title(query)])[0]
+
+    positive_prices = prices[prices > 0]
+    median = float(np.median(positive_prices)) if len(positive_prices) else 0.0
+    if median > 0:
+        ratio = prices / median
+        # 중앙값보다 지나치게 싼 매물은 부속품이나 허위 매물인 경우가 많음
+        price_score = np.where(ratio < 0.3, -1.0, np.clip(1.0 - ratio, -1.0, 1.0))
+    else:
+        price_score = np.zeros_like(prices)
+
+    tag_score = np.array([sum(TAG_WEIGHTS.get(tag, 0.0) for tag in item.tags) for item in items], dtype=np.float32)
+    tag_score = np.clip(tag_score, -1.0, 1.0)
+
+    return (
+        SCORE_WEIGHTS["relevance"] * relevance
+        + SCORE_WEIGHTS["price"] * price_score
+        + SCORE_WEIGHTS["tags"] * tag_score
+    )
+
+def rank_items(items: List[ItemRecord], query: str, sort: str = "relevance") -> List[ItemRecord]:
+    if not items:
+        return items
+
+    features = trigram_features([normalize_title(item.name) for item in items])
+    prices = np.array([item.price for item in items], dtype=np.float32)
+    platforms = np.array([item.platform for item in items])
+
+    keep = np.flatnonzero(~find_cross_platform_duplicates(features, prices, platforms))
+    if sort == "price_asc":
+        order = keep[np.argsort(prices[keep], kind="stable")]
+    elif sort == "price_desc":
+        order = keep[np.argsort(-prices[keep], kind="stable")]
+    else:
+        scores = score_items([items[i] for i in keep], query, features[keep], prices[keep])
+        order = keep[np.argsort(-scores, kind="stable")]
+
+    return [items[i] for i in order]
@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+@dataclass(slots=True)
+class ItemRecord:
+    item_id: str
+    platform: str
+    name: str
+    price: int
+    thumbnail: str
+    tags: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "item_id": self.item_id,
+            "platform": self.platform,
+            "name": self.name,
+            "price": self.price,
+            "thumbnail": self.thumbnail,
+            "tags": self.tags
+        }
+
+    def copy(self) -> "ItemRecord":
+        return ItemRecord(self.item_id, self.platform, self.name, self.price, self.thumbnail, list(self.tags))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ItemRecord":
+        return cls(data["item_id"], data["platform"], data["name"], data["price"], data["thumbnail"], data["tags"])
+
+# ItemSearchResponse와 같은 모양으로 직렬화됨
+@dataclass(slots=True)
+class SearchResult:
+    items: List[ItemRecord]
+    item_count: int
+    query: str
+    platform: str
+    platforms: List[dict]
+    next_cursor: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "items": [item.to_dict() for item in self.items],
+            "item_count": self.item_count,
+            "query": self.query,
+            "platform": self.platform,
+            "platforms": self.platforms,
+            "next_cursor": self.next_cursor
+        }
@@ -0,0 +1,69 @@
+import json
+from typing import Dict, Optional
+from app.core.config import settings
+from app.core.metrics import CACHE_LOOKUPS
+from app.core.redis import async_redis_client
+from app.utils.cache import TTLCache
+from app.utils.text import normalize_query
+from app.services.records import ItemRecord
+
+class SearchResultCache:
+    def __init__(self):
+        self.ttl = settings.SEARCH_CACHE_TTL
+        self.local = TTLCache(maxsize=settings.SEARCH_CACHE_LOCAL_SIZE, ttl=settings.SEARCH_CACHE_LOCAL_TTL)
+
+    @staticmethod
+    def key(query: str, platform: str, pages: Dict[str, int], page_size: int, sort: str = "relevance") -> str:
+        positions = ",".join(f"{name}={page}" for name, page in sorted(pages.items()))
+        return f"search_result:{platform}:{sort}:{page_size}:{positions}:{normalize_query(query)}"
+
+    @staticmethod
+    def _copy(result: dict) -> dict:
+        # 로컬 LRU의 레코드는 가변 객체이므로 요청끼리 공유하지 않도록 넣고 꺼낼 때 복사함
+        return {
+            **result,
+            "items": {platform: [item.copy() for item in items] for platform, items in result["items"].items()},
+            "platforms": [dict(status) for status in result["platforms"]],
+            "next_pages": dict(result["next_pages"])
+        }
+
+    async def get(self, key: str) -> Optional[dict]:
+        result = self.local.get(key)
+        if result is not None:
+            CACHE_LOOKUPS.labels(cache="search_result", outcome="local_hit").inc()
+            return self._copy(result)
+
+        try:
+            raw = await async_redis_client.get(key)
+        except Exception as e:
+            CACHE_LOOKUPS.labels(cache="search_result", outcome="error").inc()
+            print(f"Search cache read failed: {e}")
+            return None
+        if raw is None:
+            CACHE_LOOKUPS.labels(cache="search_result", outcome="miss").inc()
+            return None
+        CACHE_LOOKUPS.labels(cache="search_result", outcome="redis_hit").inc()
+
+        result = json.loads(raw)
+        result["items"] = {
+            platform: [ItemRecord.from_dict(item) for item in items]
+            for platform, items in result["items"].items()
+        }
+        self.local.set(key, self._copy(result))
+        return result
+
+    async def set(self, key: str, result: dict):
+        self.local.set(key, self._copy(result))
+        value = {
+            **result,
+            "items": {
+                platform: [item.to_dict() for item in items]
+                for platform, items in result["items"].items()
+            }
+        }
+        try:
+            await async_redis_client.set(key, json.dumps(value, ensure_ascii=False), ex=self.ttl)
+        except Exception as e:
+            print(f"Search cache write failed: {e}")
+
+search_result_cache = SearchResultCache()
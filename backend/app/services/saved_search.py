@@ -0,0 +1,134 @@
+import asyncio, json, time
+from collections import defaultdict
+from typing import Dict, List, Optional
+from sqlalchemy import select
+from app.core.config import settings
+from app.core.redis import async_redis_client
+from app.database import AsyncSessionLocal
+from app.models.saved_search import SavedSearch
+from app.services.records import ItemRecord
+from app.services.search import search_service
+
+SCHEDULER_LOCK_KEY = "saved_search:scheduler"
+
+class SavedSearchScheduler:
+    def __init__(
+        self,
+        interval: float = settings.SAVED_SEARCH_POLL_INTERVAL,
+        concurrency: int = settings.SAVED_SEARCH_CONCURRENCY,
+        max_matches: int = settings.SAVED_SEARCH_MAX_MATCHES
+    ):
+        self.interval = interval
+        self.concurrency = concurrency
+        self.max_matches = max_matches
+        self.seen_ttl = settings.SAVED_SEARCH_SEEN_TTL
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _seen_key(platform: str, normalized_query: str) -> str:
+        return f"saved_search:seen:{platform}:{normalized_query}"
+
+    @staticmethod
+    def matches_key(saved_search_id: int) -> str:
+        return f"saved_search:matches:{saved_search_id}"
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def get_matches(self, saved_search_id: int) -> List[dict]:
+        raw_matches = await async_redis_client.lrange(self.matches_key(saved_search_id), 0, -1)
+        return [json.loads(raw) for raw in raw_matches]
+
+    async def clear_matches(self, saved_search_id: int):
+        await async_redis_client.delete(self.matches_key(saved_search_id))
+
+    async def _run(self):
+        while True:
+            try:
+                # 여러 워커 중 한 곳에서만 주기마다 폴링
+                if await async_redis_client.set(SCHEDULER_LOCK_KEY, "1", nx=True, ex=max(int(self.interval) - 1, 1)):
+                    await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Saved search polling failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def poll(self):
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(SavedSearch))
+            saved_searches = result.scalars().all()
+
+        # 같은 검색어는 사용자 수와 관계없이 한 번만 가져옴
+        groups: Dict[str, List[SavedSearch]] = defaultdict(list)
+        for saved_search in saved_searches:
+            groups[saved_search.normalized_query].append(saved_search)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def poll_group(normalized_query: str, group: List[SavedSearch]):
+            async with semaphore:
+                try:
+                    await self._poll_query(normalized_query, group)
+                except Exception as e:
+                    print(f"Saved search polling failed for '{normalized_query}': {e}")
+
+        await asyncio.gather(*(poll_group(normalized_query, group) for normalized_query, group in groups.items()))
+
+    async def _poll_query(self, normalized_query: str, group: List[SavedSearch]):
+        platforms = {saved_search.platform for saved_search in group}
+        platform = "all" if "all" in platforms or len(platforms) > 1 else platforms.pop()
+        result = await search_service.fetch_latest(normalized_query, platform)
+
+        new_items: List[ItemRecord] = []
+        for status in result["platforms"]:
+            if status["status"] != "ok":
+                continue
+            new_items += await self._diff(status["platform"], normalized_query, result["items"][status["platform"]])
+        if not new_items:
+            return
+
+        found_at = time.time()
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            for saved_search in group:
+                matches = [
+                    item for item in search_service.filter_by_price(new_items, saved_search.min_price, saved_search.max_price)
+                    if saved_search.platform in ("all", item.platform)
+                ]
+                if not matches:
+                    continue
+                key = self.matches_key(saved_search.id)
+                pipe.lpush(key, *(json.dumps({**item.to_dict(), "found_at": found_at}, ensure_ascii=False) for item in matches))
+                pipe.ltrim(key, 0, self.max_matches - 1)
+                pipe.expire(key, self.seen_ttl)
+            await pipe.execute()
+
+    async def _diff(self, platform: str, normalized_query: str, items: List[ItemRecord]) -> List[ItemRecord]:
+        if not items:
+            return []
+
+        key = self._seen_key(platform, normalized_query)
+        item_ids = [item.item_id for item in items]
+        async with async_redis_client.pipeline(transaction=False) as pipe:
+            pipe.exists(key)
+            pipe.smismember(key, item_ids)
+            pipe.sadd(key, *item_ids)
+            pipe.expire(key, self.seen_ttl)
+            initialized, seen, _, _ = await pipe.execute()
+
+        # 처음 폴링하는 검색어는 기준점만 저장하고 알리지 않음
+        if not initialized:
+            return []
+        return [item for item, is_seen in zip(items, seen) if not is_seen]
+
+saved_search_scheduler = SavedSearchScheduler()
@@ -1,69 +1,478 @@
-from typing import List, Optional
-from app.schemas.item import ItemDetail, ItemSearchResponse, GetAutocompleteResponse
+import asyncio, time
+from collections import Counter
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from app.schemas.item import GetAutocompleteResponse, PriceStatsResponse
 from app.clients.bunjang import BunjangAPI
 from app.clients.joongna import JoongnaAPI
-from app.intelligence.pipelines import ExaonePipeline
+from app.clients.parsing import parse_joongna_product, parse_joongna_search_items
+from app.core.config import settings
+from app.core.metrics import SEARCH_STAGE_DURATION, observe
+from app.utils.fanout import fan_out
+from app.utils.cache import TTLCache
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.singleflight import SingleFlight
+from app.utils.text import normalize_query
+from app.services.detail_cache import detail_cache
+from app.services.result_cache import search_result_cache
+from app.services.autocomplete_index import autocomplete_index
+from app.services.tag_store import tag_store
+from app.services.records import ItemRecord, SearchResult
+from app.services.ranking import rank_items
+from app.services.price_stats import PriceSketch, price_stats
+from app.services.item_index import ItemIndexUnavailableError, item_index
 
 class SearchService:
     def __init__(self):
         self.bunjang_api = BunjangAPI()
         self.joongna_api = JoongnaAPI()
 
-        self.exaone_pipeline = ExaonePipeline()
+        self._exaone_pipeline = None
 
-    async def get_autocomplete(self, query: str, limit: int=10) -> GetAutocompleteResponse:
-        joongna_response = await self.joongna_api.get_autocomplete(query)
-        joongna_autocomplete = [keyword_data["keyword"] for keyword_data in joongna_response["data"]["autoCompleteItemList"]]
+        self.listers = {
+            "bunjang": self._list_bunjang,
+            "joongna": self._list_joongna
+        }
+        self.first_pages = {
+            "bunjang": 0,
+            "joongna": 1
+        }
+        # 업스트림 목록 정렬 (relevance는 각 플랫폼 기본값)
+        self.bunjang_orders = {"relevance": "score", "date": "date", "price_asc": "price_asc", "price_desc": "price_desc"}
+        self.joongna_sorts = {"relevance": None, "date": "RECENT_SORT", "price_asc": "PRICE_ASC_SORT", "price_desc": "PRICE_DESC_SORT"}
+        self.search_flight = SingleFlight()
+        self.autocomplete_flight = SingleFlight()
+        self.upstream_suggestions = TTLCache(maxsize=4096, ttl=settings.AUTOCOMPLETE_UPSTREAM_TTL)
+        self.detail_semaphores = {
+            "bunjang": asyncio.Semaphore(settings.BUNJANG_DETAIL_CONCURRENCY),
+            "joongna": asyncio.Semaphore(settings.JOONGNA_DETAIL_CONCURRENCY)
+        }
+
+    @property
+    def exaone_pipeline(self):
+        if self._exaone_pipeline is None:
+            from app.intelligence.pipelines import ExaonePipeline
+            self._exaone_pipeline = ExaonePipeline()
+        return self._exaone_pipeline
+
+    @property
+    def model_state(self) -> str:
+        if not settings.LLM_TAGGING_ENABLED:
+            return "disabled"
+        if self._exaone_pipeline is None:
+            return "not_loaded"
+        return self._exaone_pipeline.state
 
-        bunjang_response = await self.bunjang_api.get_autocomplete(query)
-        bunjang_autocomplete = [keyword_data["name"] for keyword_data in bunjang_response["keywords"]]
+    async def close(self):
+        if self._exaone_pipeline is not None:
+            await self._exaone_pipeline.close()
 
-        autocomplete = joongna_autocomplete + bunjang_autocomplete
-        autocomplete = list(set(autocomplete))
+    async def get_autocomplete(self, query: str, limit: int=10) -> GetAutocompleteResponse:
+        autocomplete = autocomplete_index.lookup(query, limit)
+
+        if len(autocomplete) < limit:
+            prefix = normalize_query(query)
+            suggestions = self.upstream_suggestions.get(prefix)
+            if suggestions is None:
+                suggestions = await self.autocomplete_flight.do(prefix, lambda: self._fetch_suggestions(query))
+            autocomplete = list(dict.fromkeys(autocomplete + suggestions))
 
         return GetAutocompleteResponse(
             keywords=autocomplete[:limit],
             keyword_count=min(limit, len(autocomplete))
         )
 
+    async def _fetch_suggestions(self, query: str) -> List[str]:
+        results = await fan_out({
+            "joongna": lambda: self._autocomplete_joongna(query),
+            "bunjang": lambda: self._autocomplete_bunjang(query)
+        }, timeout=settings.AUTOCOMPLETE_TIMEOUT)
+
+        suggestions = []
+        for result in results.values():
+            if result.status != "ok":
+                continue
+            for rank, keyword in enumerate(result.value):
+                autocomplete_index.add(keyword, weight=1 / (rank + 1))
+            suggestions += result.value
+        suggestions = list(dict.fromkeys(suggestions))
+
+        if all(result.status == "ok" for result in results.values()):
+            self.upstream_suggestions.set(normalize_query(query), suggestions)
+        return suggestions
+
+    async def _autocomplete_joongna(self, query: str) -> List[str]:
+        response = await self.joongna_api.get_autocomplete(query)
+        return [keyword_data["keyword"] for keyword_data in response["data"]["autoCompleteItemList"]]
+
+    async def _autocomplete_bunjang(self, query: str) -> List[str]:
+        response = await self.bunjang_api.get_autocomplete(query)
+        return [keyword_data["name"] for keyword_data in response["keywords"]]
+
     async def search_items(
         self,
         query: str,
         platform: str = "all",
         min_price: Optional[int] = None,
-        max_price: Optional[int] = None
-    ) -> ItemSearchResponse:
+        max_price: Optional[int] = None,
+        cursor: Optional[str] = None,
+        page_size: int = settings.SEARCH_PAGE_SIZE,
+        sort: str = "relevance",
+        source: str = "live"
+    ) -> SearchResult:
+        local_cursor = cursor is not None and "offset" in decode_cursor(cursor)
+        if source == "live" or (source == "hybrid" and cursor is not None and not local_cursor):
+            result = await self._search_live(query, platform, min_price, max_price, cursor, page_size, sort)
+        else:
+            try:
+                result = await self._search_local(query, platform, min_price, max_price, cursor, page_size, sort)
+            except ItemIndexUnavailableError as e:
+                # hybrid 첫 페이지는 로컬 인덱스 없이 업스트림 결과만으로 응답할 수 있음
+                if source != "hybrid" or cursor is not None:
+                    raise
+                print(f"{e}; falling back to live search")
+                result = await self._search_live(query, platform, min_price, max_price, None, page_size, sort)
+            else:
+                # 로컬 인덱스에 충분한 결과가 없으면 첫 페이지를 업스트림에서 채움
+                if source == "hybrid" and cursor is None and result.item_count < page_size:
+                    live_result = await self._search_live(query, platform, min_price, max_price, None, page_size, sort)
+                    # 남은 자리만큼 라이브 결과를 순서대로 채우고, 다음 커서는 채우다 멈춘 라이브 위치에서 이어감
+                    seen = {(item.platform, item.item_id) for item in result.items}
+                    items = list(result.items)
+                    consumed = 0
+                    for item in live_result.items:
+                        if len(items) >= page_size:
+                            break
+                        consumed += 1
+                        if (item.platform, item.item_id) not in seen:
+                            seen.add((item.platform, item.item_id))
+                            items.append(item)
+                    next_cursor = live_result.next_cursor
+                    if consumed < len(live_result.items):
+                        next_cursor = self._next_cursor(query, platform, self._resolve_pages(query, platform, None), sort, skip=consumed)
+
+                    items = rank_items(items, query, sort)
+                    item_counts = Counter(item.platform for item in items)
+                    result = SearchResult(
+                        items=items,
+                        item_count=len(items),
+                        query=query,
+                        platform=platform,
+                        platforms=[{**status, "item_count": item_counts[status["platform"]]} for status in live_result.platforms],
+                        next_cursor=next_cursor
+                    )
+
+        if result.items:
+            autocomplete_index.add(query, weight=settings.AUTOCOMPLETE_SEARCH_WEIGHT)
+        return result
+
+    async def _search_live(
+        self,
+        query: str,
+        platform: str,
+        min_price: Optional[int],
+        max_price: Optional[int],
+        cursor: Optional[str],
+        page_size: int,
+        sort: str
+    ) -> SearchResult:
+        # 가격순은 업스트림 목록부터 가격순으로 받아 페이지를 넘겨도 순서가 이어지게 함
+        # 정렬과 중복 제거는 플랫폼별 페이지를 합친 이 페이지 안에서만 적용됨
+        pages = self._resolve_pages(query, platform, cursor, sort)
+        result = await self._load_page(query, platform, pages, page_size, sort)
+
         items = []
+        with observe(SEARCH_STAGE_DURATION, stage="filter", platform=platform):
+            for status in result["platforms"]:
+                items += self.filter_by_price(result["items"][status["platform"]], min_price, max_price)
+        with observe(SEARCH_STAGE_DURATION, stage="ranking", platform=platform):
+            items = rank_items(items, query, sort)
+        # hybrid 첫 페이지가 이 페이지의 앞부분을 이미 보여준 경우
+        items = items[self._resolve_skip(cursor):]
 
-        if platform == "all":
-            bunjang_items = await self._search_bunjang(query, min_price, max_price)
-            joongna_items = await self._search_joongna(query, min_price, max_price)
-            items = bunjang_items + joongna_items
-        elif platform == "bunjang":
-            items = await self._search_bunjang(query, min_price, max_price)
-        elif platform == "joongna":
-            items = await self._search_joongna(query, min_price, max_price)
+        item_counts = Counter(item.platform for item in items)
+        statuses = [{**status, "item_count": item_counts[status["platform"]]} for status in result["platforms"]]
+
+        return SearchResult(
+            items=items,
+            item_count=len(items),
+            query=query,
+            platform=platform,
+            platforms=statuses,
+            next_cursor=self._next_cursor(query, platform, result["next_pages"], sort)
+        )
+
+    async def _search_local(
+        self,
+        query: str,
+        platform: str,
+        min_price: Optional[int],
+        max_price: Optional[int],
+        cursor: Optional[str],
+        page_size: int,
+        sort: str
+    ) -> SearchResult:
+        offset = self._resolve_offset(query, platform, cursor)
+        platforms = self._resolve_platforms(platform)
+
+        started = time.perf_counter()
+        with observe(SEARCH_STAGE_DURATION, stage="local_index", platform=platform):
+            items = await item_index.search(query, platforms, min_price, max_price, sort, offset, page_size + 1)
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+
+        has_more = len(items) > page_size
+        items = rank_items(items[:page_size], query, sort)
+        item_counts = Counter(item.platform for item in items)
 
-        return ItemSearchResponse(
+        return SearchResult(
             items=items,
             item_count=len(items),
             query=query,
-            platform=platform
+            platform=platform,
+            platforms=[
+                {"platform": name, "status": "ok", "item_count": item_counts[name], "elapsed_ms": elapsed_ms, "error": None}
+                for name in platforms
+            ],
+            next_cursor=encode_cursor({"q": normalize_query(query), "platform": platform, "offset": offset + page_size}) if has_more else None
+        )
+
+    async def get_price_stats(self, query: str, platform: str = "all", bins: int = 10) -> PriceStatsResponse:
+        platforms = self._resolve_platforms(platform)
+        sketches = await price_stats.load(query, platforms)
+        # 처음 보는 검색어만 첫 페이지를 가져와 스케치를 채움
+        if not any(sketch.count for sketch in sketches.values()):
+            await self.fetch_first_page(query, platform)
+            sketches = await price_stats.load(query, platforms)
+
+        stats = [{"platform": name, **sketch.summarize(bins)} for name, sketch in sketches.items()]
+        if len(sketches) > 1:
+            merged = PriceSketch(price_stats.gamma)
+            for sketch in sketches.values():
+                merged = merged.merge(sketch)
+            stats.append({"platform": "all", **merged.summarize(bins)})
+
+        return PriceStatsResponse(query=query, platforms=stats)
+
+    async def stream_items(
+        self,
+        query: str,
+        platform: str = "all",
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        cursor: Optional[str] = None,
+        page_size: int = settings.SEARCH_PAGE_SIZE
+    ) -> AsyncIterator[dict]:
+        pages = self._resolve_pages(query, platform, cursor)
+        key = search_result_cache.key(query, platform, pages, page_size)
+        result = await search_result_cache.get(key)
+        streamed = set()
+        if result is None:
+            # 캐시 미스는 일반 검색과 같은 SingleFlight로 채우고, 이 요청이 만든 작업이면 진행 중인 목록/태그를 바로 내보냄
+            events: asyncio.Queue = asyncio.Queue()
+            flight = asyncio.ensure_future(self.search_flight.do(key, lambda: self._search_unfiltered(key, query, pages, page_size, events=events)))
+            visible: Dict[str, set] = {}
+            next_event = None
+            try:
+                while not (flight.done() and events.empty()):
+                    if events.empty():
+                        next_event = asyncio.ensure_future(events.get())
+                        await asyncio.wait({next_event, flight}, return_when=asyncio.FIRST_COMPLETED)
+                        if not next_event.done():
+                            next_event.cancel()
+                            continue
+                        event = next_event.result()
+                    else:
+                        event = events.get_nowait()
+                    name = event["platform"]
+                    if event["event"] == "items":
+                        platform_items = self.filter_by_price(event["items"], min_price, max_price)
+                        visible[name] = {item.item_id for item in platform_items}
+                        streamed.add(name)
+                        yield {"event": "items", "platform": name, "items": [item.to_dict() for item in platform_items]}
+                    elif event["item_id"] in visible.get(name, ()):
+                        yield event
+                result = flight.result()
+            finally:
+                flight.cancel()
+                if next_event is not None:
+                    next_event.cancel()
+
+        for status in result["platforms"]:
+            platform_items = self.filter_by_price(result["items"][status["platform"]], min_price, max_price)
+            if status["platform"] not in streamed:
+                yield {"event": "items", "platform": status["platform"], "items": [item.to_dict() for item in platform_items]}
+            yield {"event": "status", **status, "item_count": len(platform_items)}
+        yield {"event": "done", "next_cursor": self._next_cursor(query, platform, result["next_pages"])}
+
+    async def fetch_first_page(self, query: str, platform: str = "all") -> dict:
+        # 가격 필터 전의 플랫폼별 첫 페이지 (캐시와 SingleFlight를 검색 요청과 공유)
+        pages = {name: self.first_pages[name] for name in self._resolve_platforms(platform)}
+        return await self._load_page(query, platform, pages, settings.SEARCH_PAGE_SIZE)
+
+    async def fetch_latest(self, query: str, platform: str = "all") -> dict:
+        # 저장된 검색 폴링용: 최신순 첫 페이지 목록만 가져오고 상세 조회/캐시는 건너뜀
+        query = " ".join(query.split())
+        results = await fan_out({
+            name: (lambda name=name: self.listers[name](query, self.first_pages[name], settings.SEARCH_PAGE_SIZE, "date"))
+            for name in self._resolve_platforms(platform)
+        }, timeout=settings.PLATFORM_SEARCH_TIMEOUT)
+
+        result = {"items": {}, "platforms": []}
+        for name, platform_result in results.items():
+            result["items"][name] = platform_result.value[0] if platform_result.status == "ok" else []
+            result["platforms"].append({
+                "platform": name,
+                "status": platform_result.status,
+                "item_count": len(result["items"][name]),
+                "elapsed_ms": platform_result.elapsed_ms,
+                "error": platform_result.error
+            })
+        return result
+
+    async def _load_page(self, query: str, platform: str, pages: Dict[str, int], page_size: int, sort: str = "relevance") -> dict:
+        key = search_result_cache.key(query, platform, pages, page_size, sort)
+        result = await search_result_cache.get(key)
+        if result is None:
+            result = await self.search_flight.do(key, lambda: self._search_unfiltered(key, query, pages, page_size, sort))
+        return result
+
+    async def _search_unfiltered(
+        self,
+        key: str,
+        query: str,
+        pages: Dict[str, int],
+        page_size: int,
+        sort: str = "relevance",
+        events: Optional[asyncio.Queue] = None
+    ) -> dict:
+        query = " ".join(query.split())
+        # deadline은 _search_platform 안에서 목록 조회와 상세 조회에 따로 걸림
+        results = await fan_out({
+            name: (lambda name=name, page=page: self._search_platform(name, query, page, page_size, sort, events))
+            for name, page in pages.items()
+        }, timeout=None)
+
+        result = {"items": {}, "platforms": [], "next_pages": {}}
+        for name, platform_result in results.items():
+            platform_items, has_more = platform_result.value if platform_result.status == "ok" else ([], True)
+            result["items"][name] = platform_items
+            result["platforms"].append({
+                "platform": name,
+                "status": platform_result.status,
+                "item_count": len(platform_items),
+                "elapsed_ms": platform_result.elapsed_ms,
+                "error": platform_result.error
+            })
+            # 실패한 플랫폼은 같은 페이지를 다음 커서에서 다시 시도
+            if platform_result.status != "ok":
+                result["next_pages"][name] = pages[name]
+            elif has_more:
+                result["next_pages"][name] = pages[name] + 1
+
+        await asyncio.gather(*(price_stats.record(name, query, platform_items) for name, platform_items in result["items"].items()))
+        item_index.upsert_later([item for platform_items in result["items"].values() for item in platform_items])
+
+        # 일부 플랫폼이 실패한 결과는 캐시하지 않음
+        if all(status["status"] == "ok" for status in result["platforms"]):
+            await search_result_cache.set(key, result)
+        return result
+
+    def _resolve_platforms(self, platform: str) -> List[str]:
+        platforms = list(self.listers) if platform == "all" else [platform]
+        return [name for name in platforms if name in self.listers]
+
+    def _resolve_pages(self, query: str, platform: str, cursor: Optional[str], sort: str = "relevance") -> Dict[str, int]:
+        if cursor is None:
+            return {name: self.first_pages[name] for name in self._resolve_platforms(platform)}
+
+        state = decode_cursor(cursor)
+        if state.get("q") != normalize_query(query) or state.get("platform") != platform or state.get("sort", "relevance") != sort:
+            raise ValueError("Cursor does not belong to this search")
+        pages = state.get("pages")
+        if not isinstance(pages, dict) or not all(
+            name in self.listers and isinstance(page, int) and not isinstance(page, bool) and page >= self.first_pages[name]
+            for name, page in pages.items()
+        ):
+            raise ValueError("Invalid cursor")
+        return pages
+
+    @staticmethod
+    def _resolve_skip(cursor: Optional[str]) -> int:
+        if cursor is None:
+            return 0
+        skip = decode_cursor(cursor).get("skip", 0)
+        if not isinstance(skip, int) or isinstance(skip, bool) or skip < 0:
+            raise ValueError("Invalid cursor")
+        return skip
+
+    @staticmethod
+    def _resolve_offset(query: str, platform: str, cursor: Optional[str]) -> int:
+        if cursor is None:
+            return 0
+
+        state = decode_cursor(cursor)
+        if state.get("q") != normalize_query(query) or state.get("platform") != platform:
+            raise ValueError("Cursor does not belong to this search")
+        offset = state.get("offset")
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError("Invalid cursor")
+        return offset
+
+    @staticmethod
+    def _next_cursor(query: str, platform: str, next_pages: Dict[str, int], sort: str = "relevance", skip: int = 0) -> Optional[str]:
+        if not next_pages:
+            return None
+        state = {"q": normalize_query(query), "platform": platform, "pages": next_pages}
+        if sort != "relevance":
+            state["sort"] = sort
+        if skip:
+            state["skip"] = skip
+        return encode_cursor(state)
+
+    @staticmethod
+    def filter_by_price(items: List[ItemRecord], min_price: Optional[int] = None, max_price: Optional[int] = None) -> List[ItemRecord]:
+        filtered_items = []
+        for item in items:
+            if min_price and item.price < min_price:
+                continue
+            if max_price and item.price > max_price:
+                continue
+            filtered_items.append(item)
+        return filtered_items
+
+    async def _get_item_tags(self, item_id: str, platform: str, cached: Optional[dict] = None) -> List[str]:
+        item_data = await detail_cache.get_or_fetch(
+            platform,
+            item_id,
+            lambda: self._fetch_item_data(item_id, platform),
+            cached=cached
         )
 
-    async def _get_item_tags(self, item_id: str, platform: str) -> List[str]:
+        if settings.LLM_TAGGING_ENABLED:
+            try:
+                return await tag_store.get_or_generate(
+                    item_data,
+                    self.exaone_pipeline.exaone.model_name,
+                    self.exaone_pipeline.PROMPT_VERSION,
+                    lambda: self.exaone_pipeline.generate_tag(item_data)
+                )
+            except Exception as e:
+                print(f"LLM tagging failed for {platform}:{item_id}: {e}")
+        return item_data["item_tags"].split(" / ")
+
+    async def _fetch_item_data(self, item_id: str, platform: str) -> dict[str, str]:
         if platform == "joongna":
-            response = await self.joongna_api.get_item_details(item_id)
+            product = parse_joongna_product(await self.joongna_api.get_item_details(item_id))
             item_data = {
-                "title": response['pageProps']["dehydratedState"]["queries"][1]["state"]["data"]["data"]["productTitle"],
-                "description": response['pageProps']["dehydratedState"]["queries"][1]["state"]["data"]["data"]["productDescription"],
-                "category": response['pageProps']["dehydratedState"]["queries"][1]["state"]["data"]["data"]["categoryName"],
-                "item_tags": " / ".join(response['pageProps']["dehydratedState"]["queries"][1]["state"]["data"]["data"]["labels"])
+                "title": product.title,
+                "description": product.description,
+                "category": product.category,
+                "item_tags": " / ".join(product.labels)
             }
         elif platform == "bunjang":
             response = await self.bunjang_api.get_item_details(item_id)
+            product = response["data"]["product"]
 
-            trade_method = response["data"]["product"]["trade"]
+            trade_method = product["trade"]
             item_tags = []
             if trade_method["freeShipping"]:
                 item_tags += ["택배 거래", "무료배송"]
@@ -85,73 +494,96 @@ class SearchService:
                 "HEAVILY_USED": "사용감 많음",
                 "DAMAGED": "고장/파손 상품"
             }
-            item_tags.append(item_condition[response["data"]["product"]["condition"]])
+            item_tags.append(item_condition[product["condition"]])
 
             item_data = {
-                "title": response["data"]["product"]["name"],
-                "description": response["data"]["product"]["description"],
-                "category": response["data"]["product"]["category"]["name"],
+                "title": product["name"],
+                "description": product["description"],
+                "category": product["category"]["name"],
                 "item_tags": " / ".join(item_tags)
             }
 
-        # return await self.exaone_pipeline.generate_tag(item_data)
-        return item_data["item_tags"].split(" / ")
+        return item_data
 
-    async def _search_joongna(
-        self,
-        query: str,
-        min_price: Optional[int] = None,
-        max_price: Optional[int] = None
-    ) -> List[ItemDetail]:
-        response = await self.joongna_api.search_items(query)
-        items = response["pageProps"]["dehydratedState"]["queries"][2]["state"]["data"]["data"]["items"]
+    async def _fetch_tags(self, item: ItemRecord, platform: str, cached: Optional[dict] = None) -> List[str]:
+        try:
+            # 세마포어 대기까지 포함해 상세 조회 하나가 DETAIL_FETCH_TIMEOUT을 넘지 않게 함
+            return await asyncio.wait_for(self._get_item_tags_bounded(item.item_id, platform, cached), timeout=settings.DETAIL_FETCH_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"Tag enrichment timed out for {platform}:{item.item_id}")
+        except Exception as e:
+            print(f"Tag enrichment failed for {platform}:{item.item_id}: {e}")
+        return []
 
-        filtered_items = []
-        for item in items:
-            if min_price and item['price'] < min_price:
-                continue
-            if max_price and item['price'] > max_price:
-                continue
+    async def _get_item_tags_bounded(self, item_id: str, platform: str, cached: Optional[dict] = None) -> List[str]:
+        async with self.detail_semaphores[platform]:
+            return await self._get_item_tags(item_id, platform, cached)
 
-            item_data = {
-                "item_id": str(item["seq"]),
-                "platform": "joongna",
-                "name": item["title"],
-                "price": int(item["price"]),
-                "thumbnail": item["url"],
-                "tags": await self._get_item_tags(str(item["seq"]), "joongna")
-            }
-            filtered_items.append(item_data)
-        return filtered_items
+    async def _enrich_tags(self, items: List[ItemRecord], platform: str, events: Optional[asyncio.Queue] = None) -> List[ItemRecord]:
+        # 캐시된 상세 정보는 MGET 한 번으로 미리 불러옴
+        cached = await detail_cache.load_many(platform, [item.item_id for item in items])
+
+        async def enrich(item: ItemRecord):
+            item.tags = await self._fetch_tags(item, platform, cached.get(item.item_id))
+            if events is not None:
+                events.put_nowait({"event": "tags", "platform": platform, "item_id": item.item_id, "tags": item.tags})
 
+        await asyncio.gather(*(enrich(item) for item in items))
+        return items
 
-    async def _search_bunjang(
+    async def _search_platform(
         self,
+        platform: str,
         query: str,
-        min_price: Optional[int] = None,
-        max_price: Optional[int] = None
-    ) -> List[ItemDetail]:
-        response = await self.bunjang_api.search_items(query)
+        page: int,
+        page_size: int,
+        sort: str = "relevance",
+        events: Optional[asyncio.Queue] = None
+    ) -> Tuple[List[ItemRecord], bool]:
+        with observe(SEARCH_STAGE_DURATION, stage="listing", platform=platform):
+            try:
+                items, has_more = await asyncio.wait_for(self.listers[platform](query, page, page_size, sort), timeout=settings.PLATFORM_SEARCH_TIMEOUT)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(f"no response within {settings.PLATFORM_SEARCH_TIMEOUT}s")
+        if events is not None:
+            events.put_nowait({"event": "items", "platform": platform, "items": items})
+        # 상세 조회는 건별 deadline이 있어 늦어져도 태그만 비고 플랫폼 결과는 유지됨
+        with observe(SEARCH_STAGE_DURATION, stage="enrichment", platform=platform):
+            items = await self._enrich_tags(items, platform, events)
+        return items, has_more
+
+    async def _list_joongna(self, query: str, page: int = 1, page_size: int = settings.SEARCH_PAGE_SIZE, sort: str = "relevance") -> Tuple[List[ItemRecord], bool]:
+        # 중고나라는 페이지 크기를 지정할 수 없어 page_size를 무시
+        response = await self.joongna_api.search_items(query, page=page, sort=self.joongna_sorts[sort])
+        items = parse_joongna_search_items(response)
+
+        listed_items = []
+        for item in items:
+            listed_items.append(ItemRecord(
+                item_id=str(item["seq"]),
+                platform="joongna",
+                name=item["title"],
+                price=int(item["price"]),
+                thumbnail=item["url"]
+            ))
+        return listed_items, len(items) > 0
+
+    async def _list_bunjang(self, query: str, page: int = 0, page_size: int = settings.SEARCH_PAGE_SIZE, sort: str = "relevance") -> Tuple[List[ItemRecord], bool]:
+        response = await self.bunjang_api.search_items(query, page=page, limit=page_size, order=self.bunjang_orders[sort])
         items = response['list']
 
-        filtered_items = []
+        listed_items = []
         for item in items:
             if "ad" not in item or not item["ad"]:
                 continue
-            if min_price and item['price'] < min_price:
-                continue
-            if max_price and item['price'] > max_price:
-                continue
 
-            item_data = {
-                "item_id": str(item["pid"]),
-                "platform": "bunjang",
-                "name": item["name"],
-                "price": int(item["price"]),
-                "thumbnail": item["product_image"],
-                "tags": await self._get_item_tags(str(item["pid"]), "bunjang")
-            }
-            filtered_items.append(item_data)
-        return filtered_items
+            listed_items.append(ItemRecord(
+                item_id=str(item["pid"]),
+                platform="bunjang",
+                name=item["name"],
+                price=int(item["price"]),
+                thumbnail=item["product_image"]
+            ))
+        return listed_items, len(items) >= page_size
 
 search_service = SearchService()
@@ -0,0 +1,81 @@
+import hashlib, json
+from typing import Awaitable, Callable, Dict, List, Optional
+from sqlalchemy.dialects.postgresql import insert
+from app.core.config import settings
+from app.core.redis import async_redis_client
+from app.database import AsyncSessionLocal
+from app.models.generated_tag import GeneratedTag
+from app.utils.cache import TTLCache
+
+TAG_SOURCE_FIELDS = ("title", "description", "category", "item_tags")
+
+class TagStore:
+    def __init__(self, redis_ttl: int = settings.TAG_STORE_REDIS_TTL):
+        self.redis_ttl = redis_ttl
+        self.local = TTLCache(maxsize=settings.TAG_STORE_LOCAL_SIZE, ttl=settings.TAG_STORE_LOCAL_TTL)
+
+    @staticmethod
+    def content_hash(item_data: Dict[str, str], model_name: str, prompt_version: str) -> str:
+        content = {field: item_data[field] for field in TAG_SOURCE_FIELDS}
+        content.update(model_name=model_name, prompt_version=prompt_version)
+        raw = json.dumps(content, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    async def get_or_generate(
+        self,
+        item_data: Dict[str, str],
+        model_name: str,
+        prompt_version: str,
+        generate: Callable[[], Awaitable[List[str]]]
+    ) -> List[str]:
+        content_hash = self.content_hash(item_data, model_name, prompt_version)
+
+        # 로컬 -> Redis -> DB 순으로 찾고, 모두 없을 때만 생성
+        tags = self.local.get(content_hash)
+        if tags is not None:
+            return list(tags)
+
+        tags = await self._get_hot(content_hash)
+        if tags is None:
+            tags = await self._get_persisted(content_hash)
+            if tags is None:
+                tags = await generate()
+                await self._persist(content_hash, model_name, prompt_version, tags)
+            await self._set_hot(content_hash, tags)
+        self.local.set(content_hash, list(tags))
+        return tags
+
+    async def _get_hot(self, content_hash: str) -> Optional[List[str]]:
+        try:
+            raw = await async_redis_client.get(f"generated_tags:{content_hash}")
+        except Exception as e:
+            print(f"Tag store read failed: {e}")
+            return None
+        return json.loads(raw) if raw else None
+
+    async def _set_hot(self, content_hash: str, tags: List[str]):
+        try:
+            await async_redis_client.set(f"generated_tags:{content_hash}", json.dumps(tags, ensure_ascii=False), ex=self.redis_ttl)
+        except Exception as e:
+            print(f"Tag store write failed: {e}")
+
+    @staticmethod
+    async def _get_persisted(content_hash: str) -> Optional[List[str]]:
+        async with AsyncSessionLocal() as db:
+            row = await db.get(GeneratedTag, content_hash)
+            return row.tags if row else None
+
+    @staticmethod
+    async def _persist(content_hash: str, model_name: str, prompt_version: str, tags: List[str]):
+        # 여러 워커가 같은 매물을 동시에 생성해도 먼저 저장된 태그를 유지
+        statement = insert(GeneratedTag).values(
+            content_hash=content_hash,
+            model_name=model_name,
+            prompt_version=prompt_version,
+            tags=tags
+        ).on_conflict_do_nothing(index_elements=[GeneratedTag.content_hash])
+        async with AsyncSessionLocal() as db:
+            await db.execute(statement)
+            await db.commit()
+
+tag_store = TagStore()
@@ -0,0 +1,15 @@
+import base64, binascii, json
+
+def encode_cursor(state: dict) -> str:
+    raw = json.dumps(state, separators=(",", ":"), ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        state = json.loads(raw)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+    if not isinstance(state, dict):
+        raise ValueError("Invalid cursor")
+    return state
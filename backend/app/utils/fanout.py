@@ -0,0 +1,32 @@
+import asyncio, time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+@dataclass
+class FanOutResult:
+    name: str
+    status: str # ok, timeout or error
+    value: Any = None
+    error: Optional[str] = None
+    elapsed_ms: int = 0
+
+async def _run_with_deadline(name: str, call: Callable[[], Awaitable[Any]], timeout: Optional[float]) -> FanOutResult:
+    started = time.perf_counter()
+    try:
+        value = await asyncio.wait_for(call(), timeout=timeout)
+        status, error = "ok", None
+    except asyncio.TimeoutError as e:
+        # 응답에는 고정된 사유만 담고 자세한 내용(호출 안쪽 deadline 메시지 등)은 서버 로그로 남김
+        print(f"{name} timed out: {str(e) or f'no response within {timeout}s'}")
+        value, status, error = None, "timeout", "timeout"
+    except Exception as e:
+        print(f"{name} failed: {e.__class__.__name__}: {e}")
+        value, status, error = None, "error", "upstream error"
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+    return FanOutResult(name=name, status=status, value=value, error=error, elapsed_ms=elapsed_ms)
+
+async def fan_out(calls: Dict[str, Callable[[], Awaitable[Any]]], timeout: Optional[float]) -> Dict[str, FanOutResult]:
+    results = await asyncio.gather(*(
+        _run_with_deadline(name, call, timeout) for name, call in calls.items()
+    ))
+    return {result.name: result for result in results}
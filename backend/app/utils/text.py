@@ -0,0 +1,2 @@
+def normalize_query(query: str) -> str:
+    return " ".join(query.split()).casefold()
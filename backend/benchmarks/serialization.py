@@ -0,0 +1,51 @@
+# 사용법: backend 디렉터리에서 `python -m benchmarks.serialization`
+import json, timeit
+from fastapi.encoders import jsonable_encoder
+from app.schemas.item import ItemSearchResponse
+from app.services.records import ItemRecord, SearchResult
+from app.api.responses import RecordJSONResponse
+
+ITEM_COUNT = 200
+ROUNDS = 200
+
+def make_records() -> list:
+    return [
+        ItemRecord(
+            item_id=str(100000 + i),
+            platform="bunjang" if i % 2 else "joongna",
+            name=f"아이폰 15 프로 256GB 블랙 티타늄 {i}",
+            price=1000000 + i * 1000,
+            thumbnail=f"https://media.example.com/product/{i}_w{{res}}.jpg",
+            tags=["택배 거래", "직거래", "사용감 적음"]
+        )
+        for i in range(ITEM_COUNT)
+    ]
+
+def make_platforms() -> list:
+    return [
+        {"platform": "bunjang", "status": "ok", "item_count": ITEM_COUNT // 2, "elapsed_ms": 120, "error": None},
+        {"platform": "joongna", "status": "ok", "item_count": ITEM_COUNT // 2, "elapsed_ms": 180, "error": None}
+    ]
+
+def pydantic_path(records: list, platforms: list) -> bytes:
+    # 기존 경로: dict -> pydantic 모델 -> response_model 재검증 -> jsonable_encoder -> json.dumps
+    items = [record.to_dict() for record in records]
+    response = ItemSearchResponse(items=items, item_count=len(items), query="아이폰", platform="all", platforms=platforms)
+    validated = ItemSearchResponse.model_validate(response.model_dump())
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False).encode()
+
+def record_path(records: list, platforms: list) -> bytes:
+    result = SearchResult(items=records, item_count=len(records), query="아이폰", platform="all", platforms=platforms)
+    return RecordJSONResponse(result).body
+
+def main():
+    records = make_records()
+    platforms = make_platforms()
+    assert json.loads(pydantic_path(records, platforms)) == json.loads(record_path(records, platforms))
+
+    for name, func in (("pydantic + response_model", pydantic_path), ("slots record + RecordJSONResponse", record_path)):
+        seconds = min(timeit.repeat(lambda: func(records, platforms), number=ROUNDS, repeat=5))
+        print(f"{name:<36} {seconds / ROUNDS * 1e6:10.1f} us/response ({ITEM_COUNT} items)")
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,21 @@
-from fastapi import FastAPI
+import asyncio, time
+from contextlib import contextmanager
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import sql_connection, create_tables
+from app.database import sql_connection, create_tables, close_async_engine
 from app.core.config import settings
-from app.core.redis import redis_connection
-from app.api import auth, users, platforms, items
+from app.core.redis import redis_connection, close_redis
+from app.core.auth_cache import local_token_blacklist
+from app.core.hashing import HashingBusyError, password_hasher
+from app.core.metrics import CONTENT_TYPE_LATEST, HTTP_REQUEST_DURATION, mark_process_dead, render_metrics
+from app.clients.http import http_clients
+from app.clients.bunjang import BunjangAPI
+from app.clients.joongna import JoongnaAPI
+from app.services.search import search_service
+from app.services.item_index import ItemIndexUnavailableError, item_index
+from app.services.saved_search import saved_search_scheduler
+from app.api import auth, users, platforms, items, saved_searches
 
 app = FastAPI(title=settings.APP_NAME, version=settings.VERSION)
 
@@ -15,17 +27,113 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    started = time.perf_counter()
+
+    def record(status: int):
+        # 경로 파라미터별로 라벨이 늘어나지 않도록 라우트 템플릿을 사용
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.labels(
+            method=request.method,
+            route=route.path if route is not None else "unmatched",
+            status=str(status)
+        ).observe(time.perf_counter() - started)
+
+    try:
+        response = await call_next(request)
+    except Exception:
+        record(500)
+        raise
+
+    # /items/search/stream처럼 본문을 나눠 보내는 응답도 헤더가 아니라 본문을 다 보낸 시점까지 기록
+    body_iterator = response.body_iterator
+
+    async def timed_body():
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            record(response.status_code)
+
+    response.body_iterator = timed_body()
+    return response
+
+@contextmanager
+def startup_phase(name: str):
+    started = time.perf_counter()
+    yield
+    print(f"[startup] {name}: {(time.perf_counter() - started) * 1000:.1f}ms")
+
 @app.on_event("startup")
 async def startup_event():
-    sql_connection()
-    redis_connection()
-    create_tables() # 개발용
+    with startup_phase("total"):
+        with startup_phase("database"):
+            sql_connection()
+        with startup_phase("redis"):
+            await redis_connection()
+        with startup_phase("create tables"):
+            create_tables() # 개발용
+        with startup_phase("http clients"):
+            http_clients.open(BunjangAPI.BASE_URL, JoongnaAPI.SEARCH_API_URL, JoongnaAPI.WEB_URL)
+        with startup_phase("token blacklist sync"):
+            await local_token_blacklist.start()
+        with startup_phase("password hasher"):
+            password_hasher.start()
+
+    if settings.SAVED_SEARCH_ENABLED:
+        await saved_search_scheduler.start()
+
+    # 모델 로딩은 오래 걸리므로 백그라운드에서 진행하고 /health로 준비 상태를 알림
+    if settings.LLM_TAGGING_ENABLED and settings.MODEL_PRELOAD:
+        app.state.model_warmup = asyncio.create_task(search_service.exaone_pipeline.warmup())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await saved_search_scheduler.stop()
+    await local_token_blacklist.stop()
+    await http_clients.close()
+    await search_service.close()
+    await item_index.close()
+    await close_async_engine()
+    await close_redis()
+    password_hasher.shutdown()
+    mark_process_dead()
+
+@app.exception_handler(HashingBusyError)
+async def hashing_busy_handler(request: Request, exc: HashingBusyError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server is busy, please try again shortly"},
+        headers={"Retry-After": "1"}
+    )
+
+@app.exception_handler(ItemIndexUnavailableError)
+async def item_index_unavailable_handler(request: Request, exc: ItemIndexUnavailableError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Local item index is unavailable, try source=live"},
+        headers={"Retry-After": "5"}
+    )
 
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(platforms.router)
 app.include_router(items.router)
+app.include_router(saved_searches.router)
 
 @app.get("/")
 async def root():
     return {"message": "Welcome to '심밧다' backend"}
+
+@app.get("/health")
+async def health(response: Response):
+    model_state = search_service.model_state
+    ready = not (settings.LLM_TAGGING_ENABLED and settings.MODEL_PRELOAD) or model_state == "ready"
+    if not ready:
+        response.status_code = 503
+    return {"status": "ok" if ready else "starting", "model": model_state}
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
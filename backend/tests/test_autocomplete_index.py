@@ -0,0 +1,40 @@
+from app.services.autocomplete_index import AutocompleteIndex
+
+def test_lookup_matches_by_prefix_only():
+    index = AutocompleteIndex()
+    for keyword in ("아이폰 15", "아이폰 케이스", "아이패드", "갤럭시 아이폰"):
+        index.add(keyword)
+
+    assert sorted(index.lookup("아이폰")) == ["아이폰 15", "아이폰 케이스"]
+    assert sorted(index.lookup("아이")) == ["아이패드", "아이폰 15", "아이폰 케이스"]
+    assert index.lookup("맥북") == []
+
+def test_higher_weight_ranks_first_and_limit_applies():
+    index = AutocompleteIndex()
+    index.add("아이폰 케이스")
+    index.add("아이폰 15", weight=3)
+    index.add("아이폰 14")
+    index.add("아이폰 14")
+
+    assert index.lookup("아이폰") == ["아이폰 15", "아이폰 14", "아이폰 케이스"]
+    assert index.lookup("아이폰", limit=1) == ["아이폰 15"]
+
+def test_keywords_are_normalized_but_keep_their_first_spelling():
+    index = AutocompleteIndex()
+    index.add("  iPhone   15 ")
+    index.add("IPHONE 15")
+    index.add("   ")
+
+    assert len(index) == 1
+    assert index.lookup("iphone") == ["iPhone   15"]
+    assert index.lookup("IPHONE  1") == ["iPhone   15"]
+
+def test_prune_drops_the_lowest_scores():
+    index = AutocompleteIndex(max_keywords=10)
+    for i in range(10):
+        index.add(f"keyword {i}", weight=i + 1)
+    index.add("keyword new", weight=0.5)
+
+    assert len(index) == 9
+    assert "keyword new" not in index.lookup("keyword", limit=20)
+    assert "keyword 9" in index.lookup("keyword", limit=20)
@@ -0,0 +1,46 @@
+import time
+from app.utils.cache import TTLCache
+
+def test_get_returns_stored_value_until_ttl_expires(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("a", 1)
+
+    now[0] = 109.9
+    assert cache.get("a") == 1
+    now[0] = 110.1
+    assert cache.get("a") is None
+
+def test_per_entry_ttl_overrides_default(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2)
+
+    now[0] = 5
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+def test_evicts_least_recently_used_entry():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+def test_pop_and_clear():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.pop("a")
+    cache.pop("missing")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert cache.get("b") is None
@@ -0,0 +1,33 @@
+import base64
+import pytest
+from app.services.search import SearchService
+from app.utils.cursor import encode_cursor, decode_cursor
+
+def test_round_trip_preserves_state():
+    state = {"q": "아이폰 15", "platform": "all", "pages": {"bunjang": 2, "joongna": 3}}
+    assert decode_cursor(encode_cursor(state)) == state
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor({"q": "?/+=" * 10})
+    assert "=" not in cursor
+    assert not set(cursor) & set("+/")
+
+@pytest.mark.parametrize("cursor", ["%%%", "bm90IGpzb24", ""])
+def test_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+def test_non_object_state_is_rejected():
+    cursor = base64.urlsafe_b64encode(b"[1, 2]").decode()
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+@pytest.mark.parametrize("pages", [{"bunjang": True}, {"bunjang": -1}, {"joongna": 0}, {"bunjang": "1"}, {"unknown": 1}, []])
+def test_search_rejects_invalid_cursor_pages(pages):
+    cursor = encode_cursor({"q": "아이폰", "platform": "all", "pages": pages})
+    with pytest.raises(ValueError):
+        SearchService()._resolve_pages("아이폰", "all", cursor)
+
+def test_search_accepts_cursor_pages_from_the_first_page():
+    cursor = encode_cursor({"q": "아이폰", "platform": "all", "pages": {"bunjang": 0, "joongna": 1}})
+    assert SearchService()._resolve_pages("아이폰", "all", cursor) == {"bunjang": 0, "joongna": 1}
@@ -0,0 +1,49 @@
+import asyncio
+from app.utils.fanout import fan_out
+
+async def ok(value):
+    return value
+
+async def slow():
+    await asyncio.sleep(1)
+    return "late"
+
+async def fail():
+    raise RuntimeError("upstream down")
+
+def test_fan_out_reports_each_call_independently():
+    results = asyncio.run(fan_out({
+        "fast": lambda: ok([1, 2]),
+        "slow": slow,
+        "broken": fail
+    }, timeout=0.05))
+
+    assert results["fast"].status == "ok"
+    assert results["fast"].value == [1, 2]
+    assert results["slow"].status == "timeout"
+    assert results["slow"].value is None
+    assert results["broken"].status == "error"
+    assert results["slow"].error == "timeout"
+    assert results["broken"].error == "upstream error"
+
+def test_fan_out_runs_calls_concurrently():
+    async def sleeper():
+        await asyncio.sleep(0.1)
+        return True
+
+    async def run():
+        started = asyncio.get_running_loop().time()
+        results = await fan_out({name: sleeper for name in ("a", "b", "c")}, timeout=1)
+        return results, asyncio.get_running_loop().time() - started
+
+    results, elapsed = asyncio.run(run())
+    assert all(result.status == "ok" for result in results.values())
+    assert elapsed < 0.25
+
+def test_fan_out_logs_details_but_returns_a_fixed_reason(capsys):
+    async def leaky():
+        raise ValueError("https://internal.example/api?token=secret")
+
+    results = asyncio.run(fan_out({"leaky": leaky}, timeout=1))
+    assert results["leaky"].error == "upstream error"
+    assert "token=secret" in capsys.readouterr().out
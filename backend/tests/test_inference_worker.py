@@ -0,0 +1,72 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from app.intelligence.worker import InferenceWorker
+
+def echo_batch(batch, max_length):
+    return [messages[0]["content"].upper() for messages in batch]
+
+def test_requests_are_batched():
+    batches = []
+
+    def generate_batch(batch, max_length):
+        batches.append(len(batch))
+        return echo_batch(batch, max_length)
+
+    worker = InferenceWorker(SimpleNamespace(generate_batch=generate_batch), max_batch_size=8, max_wait_ms=20)
+
+    async def run():
+        outputs = await asyncio.gather(*(worker.submit([{"role": "user", "content": f"q{i}"}]) for i in range(5)))
+        await worker.stop()
+        return outputs
+
+    assert asyncio.run(run()) == ["Q0", "Q1", "Q2", "Q3", "Q4"]
+    assert sum(batches) == 5
+    assert len(batches) < 5
+
+def test_worker_can_restart_after_stop():
+    worker = InferenceWorker(SimpleNamespace(generate_batch=echo_batch), max_wait_ms=1)
+
+    async def run():
+        first = await worker.submit([{"role": "user", "content": "a"}])
+        await worker.stop()
+        second = await worker.submit([{"role": "user", "content": "b"}])
+        third = await worker.run(lambda: "direct")
+        await worker.stop()
+        return first, second, third
+
+    assert asyncio.run(run()) == ("A", "B", "direct")
+
+def test_batch_failure_is_delivered_to_each_caller():
+    def broken(batch, max_length):
+        raise RuntimeError("Text generation failed")
+
+    worker = InferenceWorker(SimpleNamespace(generate_batch=broken), max_wait_ms=1)
+
+    async def run():
+        results = await asyncio.gather(worker.submit([{"role": "user", "content": "a"}]), return_exceptions=True)
+        await worker.stop()
+        return results
+
+    assert isinstance(asyncio.run(run())[0], RuntimeError)
+
+def test_stop_fails_queued_and_in_flight_requests():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_batch(batch, max_length):
+        started.set()
+        release.wait(1)
+        return echo_batch(batch, max_length)
+
+    worker = InferenceWorker(SimpleNamespace(generate_batch=slow_batch), max_batch_size=1, max_wait_ms=1)
+
+    async def run():
+        requests = [asyncio.ensure_future(worker.submit([{"role": "user", "content": f"q{i}"}])) for i in range(3)]
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 1)
+        await worker.stop()
+        release.set()
+        return await asyncio.wait_for(asyncio.gather(*requests, return_exceptions=True), 1)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,33 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api import items
+from app.api.deps import get_current_user
+from app.schemas.item import PriceStatsResponse
+
+@pytest.fixture
+def client(monkeypatch):
+    calls = []
+
+    async def get_price_stats(query, platform="all", bins=10):
+        calls.append(platform)
+        return PriceStatsResponse(query=query, platforms=[])
+
+    monkeypatch.setattr(items.search_service, "get_price_stats", get_price_stats)
+    app = FastAPI()
+    app.include_router(items.router)
+    app.dependency_overrides[get_current_user] = lambda: None
+    client = TestClient(app)
+    client.calls = calls
+    return client
+
+@pytest.mark.parametrize("path", ["/items/search", "/items/search/stream", "/items/price-stats"])
+def test_unsupported_platform_is_rejected(client, path):
+    response = client.get(path, params={"query": "아이폰", "platform": "joonggonara"})
+    assert response.status_code == 422
+
+@pytest.mark.parametrize("platform", ["bunjang", "joongna", "all"])
+def test_supported_platforms_reach_the_service(client, platform):
+    response = client.get("/items/price-stats", params={"query": "아이폰", "platform": platform})
+    assert response.status_code == 200
+    assert client.calls == [platform]
@@ -0,0 +1,54 @@
+import asyncio
+import fakeredis
+import httpx
+import pytest
+from app.clients import joongna as joongna_module
+from app.clients.joongna import JoongnaAPI
+
+class FakeUpstream:
+    def __init__(self, build_id: str, live_ids: set):
+        self.build_id = build_id
+        self.live_ids = live_ids
+        self.urls = []
+
+    async def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        request = httpx.Request(method, url)
+        if url == f"{JoongnaAPI.WEB_URL}/":
+            return httpx.Response(200, text=f'{{"buildId":"{self.build_id}"}}', request=request)
+        if f"/_next/data/{self.build_id}/" in url and any(f"product/{item_id}.json" in url for item_id in self.live_ids):
+            return httpx.Response(200, content=b'{"pageProps": {}}', request=request)
+        return httpx.Response(404, request=request)
+
+@pytest.fixture
+def api(monkeypatch):
+    monkeypatch.setattr(joongna_module, "async_redis_client", fakeredis.FakeAsyncRedis(decode_responses=True))
+    return JoongnaAPI()
+
+def test_stale_build_id_is_refreshed_once(api, monkeypatch):
+    upstream = FakeUpstream("new", live_ids={"1"})
+    monkeypatch.setattr(joongna_module, "http_clients", upstream)
+    api.build_id_resolver._build_id = "old"
+
+    payload = asyncio.run(api._get_next_data("product/1.json", {}, {}, endpoint="detail"))
+    assert payload == {"pageProps": {}}
+    assert upstream.urls == [
+        f"{JoongnaAPI.WEB_URL}/_next/data/old/product/1.json",
+        f"{JoongnaAPI.WEB_URL}/",
+        f"{JoongnaAPI.WEB_URL}/_next/data/new/product/1.json"
+    ]
+
+def test_deleted_product_404_does_not_refetch_build_id(api, monkeypatch):
+    upstream = FakeUpstream("current", live_ids=set())
+    monkeypatch.setattr(joongna_module, "http_clients", upstream)
+    api.build_id_resolver._build_id = "current"
+
+    async def run():
+        for item_id in ("1", "2", "3"):
+            with pytest.raises(httpx.HTTPStatusError):
+                await api._get_next_data(f"product/{item_id}.json", {}, {}, endpoint="detail")
+
+    asyncio.run(run())
+    # 첫 404에서 한 번 확인한 뒤로는 같은 build id로 재시도하지도, 다시 받지도 않음
+    assert upstream.urls.count(f"{JoongnaAPI.WEB_URL}/") == 1
+    assert len(upstream.urls) == 4
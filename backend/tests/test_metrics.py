@@ -0,0 +1,59 @@
+import asyncio
+import sqlite3
+import fakeredis
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+import main
+from app.core.metrics import render_metrics
+from app.core.redis import TimedRedis
+from app.database import TimedAsyncQueuePool, TimedQueuePool
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+def test_request_metrics_are_rendered():
+    response = TestClient(main.app).get("/health")
+
+    assert response.status_code == 200
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in render_metrics().decode()
+
+def test_streamed_requests_are_timed_until_the_body_ends():
+    app = FastAPI()
+    app.middleware("http")(main.record_request_metrics)
+
+    @app.get("/slow-stream")
+    async def slow_stream():
+        async def body():
+            yield "a\n"
+            await asyncio.sleep(0.1)
+            yield "b\n"
+        return StreamingResponse(body())
+
+    assert TestClient(app).get("/slow-stream").text == "a\nb\n"
+    assert sample("http_request_duration_seconds_sum", method="GET", route="/slow-stream", status="200") >= 0.1
+
+def test_redis_commands_and_pipelines_are_rendered():
+    redis = TimedRedis(connection_pool=fakeredis.FakeAsyncRedis().connection_pool)
+
+    async def run():
+        await redis.set("metrics:key", "1")
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.get("metrics:key")
+            await pipe.execute()
+
+    asyncio.run(run())
+    metrics = render_metrics().decode()
+    assert 'redis_command_duration_seconds_count{command="SET"}' in metrics
+    assert 'redis_command_duration_seconds_count{command="PIPELINE"}' in metrics
+
+def test_pool_checkouts_are_rendered():
+    before = {engine: sample("db_pool_checkout_wait_seconds_count", engine=engine) for engine in ("sync", "async")}
+    for pool_class in (TimedQueuePool, TimedAsyncQueuePool):
+        pool = pool_class(lambda: sqlite3.connect(":memory:"))
+        pool.connect().close()
+        pool.dispose()
+
+    assert sample("db_pool_checkout_wait_seconds_count", engine="sync") == before["sync"] + 1
+    assert sample("db_pool_checkout_wait_seconds_count", engine="async") == before["async"] + 1
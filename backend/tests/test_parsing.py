@@ -0,0 +1,21 @@
+from prometheus_client import REGISTRY
+from app.clients.parsing import find_query_data, loads
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+def test_loads_decodes_and_records_metrics():
+    payload = loads('{"name": "아이폰"}'.encode(), "parsing.test")
+    assert payload == {"name": "아이폰"}
+    assert sample("upstream_parse_duration_seconds_count", source="parsing.test") == 1
+    assert sample("upstream_parse_bytes_total", source="parsing.test") == len('{"name": "아이폰"}'.encode())
+
+def test_find_query_data_matches_by_key_not_position():
+    payload = {"pageProps": {"dehydratedState": {"queries": [
+        {"state": {"data": None}},
+        {"state": {"data": {"data": {"productTitle": "아이폰"}}}},
+        {"state": {"data": {"data": {"items": [1, 2]}}}}
+    ]}}}
+    assert find_query_data(payload, "items") == {"items": [1, 2]}
+    assert find_query_data(payload, "productTitle") == {"productTitle": "아이폰"}
+    assert find_query_data(payload, "missing") is None
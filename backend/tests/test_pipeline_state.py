@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+from app.intelligence.pipelines import ExaonePipeline
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    pipeline = ExaonePipeline()
+    loads = []
+    monkeypatch.setattr(pipeline.exaone, "load", lambda: loads.append(1))
+    monkeypatch.setattr(pipeline.exaone, "generate_batch", lambda batch, max_length: ["직거래, 새상품"] * len(batch))
+    pipeline.loads = loads
+    return pipeline
+
+ITEM = {"title": "아이폰", "description": "", "category": "휴대폰", "item_tags": "직거래"}
+
+def test_lazy_load_on_first_tag_marks_pipeline_ready(pipeline):
+    async def run():
+        assert pipeline.state == "not_loaded"
+        tags = await asyncio.gather(pipeline.generate_tag(ITEM), pipeline.generate_tag(ITEM))
+        await pipeline.close()
+        return tags
+
+    assert asyncio.run(run()) == [["직거래", "새상품"]] * 2
+    assert pipeline.state == "ready"
+    assert pipeline.loads == [1]
+
+def test_failed_lazy_load_is_reported_and_retried(pipeline, monkeypatch):
+    def broken_load():
+        raise RuntimeError("Model loading failed: no weights")
+
+    monkeypatch.setattr(pipeline.exaone, "load", broken_load)
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await pipeline.generate_tag(ITEM)
+        failed_state = pipeline.state
+        monkeypatch.setattr(pipeline.exaone, "load", lambda: None)
+        await pipeline.generate_tag(ITEM)
+        await pipeline.close()
+        return failed_state
+
+    assert asyncio.run(run()) == "failed"
+    assert pipeline.state == "ready"
+
+def test_warmup_reports_warming_until_first_generation_succeeds(pipeline, monkeypatch):
+    states = []
+
+    def generate_batch(batch, max_length):
+        states.append(pipeline.state)
+        return ["직거래"] * len(batch)
+
+    monkeypatch.setattr(pipeline.exaone, "generate_batch", generate_batch)
+
+    async def run():
+        await pipeline.warmup()
+        await pipeline.close()
+
+    asyncio.run(run())
+    assert states == ["warming"]
+    assert pipeline.state == "ready"
+
+def test_failed_warmup_generation_is_not_ready(pipeline, monkeypatch):
+    def broken_generate(batch, max_length):
+        raise RuntimeError("CUDA out of memory")
+
+    monkeypatch.setattr(pipeline.exaone, "generate_batch", broken_generate)
+
+    async def run():
+        await pipeline.warmup()
+        await pipeline.close()
+
+    asyncio.run(run())
+    assert pipeline.state == "failed"
@@ -0,0 +1,56 @@
+import numpy as np
+from app.services.price_stats import PriceSketch, PriceStatsStore
+
+store = PriceStatsStore(relative_accuracy=0.01)
+
+def sketch_of(prices):
+    sketch = PriceSketch(store.gamma)
+    for price in prices:
+        index = store.bucket(price)
+        sketch.counts[index] = sketch.counts.get(index, 0) + 1
+    sketch.min_price, sketch.max_price = min(prices), max(prices)
+    return sketch
+
+def test_empty_sketch_summary():
+    assert PriceSketch(store.gamma).summarize(bins=10) == {
+        "count": 0, "min_price": None, "max_price": None, "quantiles": {}, "histogram": []
+    }
+
+def test_quantiles_stay_within_relative_accuracy():
+    prices = list(range(10000, 1010000, 1000))
+    summary = sketch_of(prices).summarize(bins=10)
+
+    assert summary["count"] == len(prices)
+    assert summary["min_price"] == 10000
+    assert summary["max_price"] == 1009000
+    for name, q in (("p10", 0.1), ("p50", 0.5), ("p90", 0.9)):
+        expected = np.quantile(prices, q)
+        assert abs(summary["quantiles"][name] - expected) / expected < 0.03
+
+def test_histogram_covers_range_and_counts_every_price():
+    prices = [10000, 20000, 30000, 40000, 50000, 90000]
+    histogram = sketch_of(prices).summarize(bins=4)["histogram"]
+
+    assert len(histogram) == 4
+    assert histogram[0]["lower"] == 10000
+    assert histogram[-1]["upper"] == 90000
+    assert sum(bucket["count"] for bucket in histogram) == len(prices)
+
+def test_single_price_collapses_to_one_bin():
+    summary = sketch_of([25000, 25000, 25000]).summarize(bins=10)
+
+    assert summary["histogram"] == [{"lower": 25000, "upper": 25000, "count": 3}]
+    assert set(summary["quantiles"].values()) == {25000}
+
+def test_merge_adds_counts_and_widens_range():
+    left, right = sketch_of([10000, 20000]), sketch_of([20000, 80000])
+    merged = left.merge(right)
+
+    assert merged.count == 4
+    assert (merged.min_price, merged.max_price) == (10000, 80000)
+    assert merged.counts[store.bucket(20000)] == 2
+    assert left.count == 2
+
+def test_merge_with_empty_sketch_keeps_bounds():
+    merged = PriceSketch(store.gamma).merge(sketch_of([5000]))
+    assert (merged.min_price, merged.max_price, merged.count) == (5000, 5000, 1)
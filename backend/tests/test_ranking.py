@@ -0,0 +1,84 @@
+import os, subprocess, sys
+import numpy as np
+from app.services.records import ItemRecord
+from app.services.ranking import normalize_title, trigram_features, rank_items
+
+def record(item_id, platform, name, price, tags=None):
+    return ItemRecord(item_id=item_id, platform=platform, name=name, price=price, thumbnail="", tags=tags or [])
+
+def ids(items):
+    return [item.item_id for item in items]
+
+def test_normalize_title_folds_width_case_and_punctuation():
+    assert normalize_title("ＩＰＨＯＮＥ 15  Pro!!") == "iphone 15 pro"
+
+def test_trigram_features_are_unit_vectors_and_ignore_spacing():
+    features = trigram_features(["아이폰 15 프로", "아이폰15프로", "갤럭시 s24"])
+    assert np.allclose(np.linalg.norm(features, axis=1), 1.0)
+    assert features[0] @ features[1] > 0.99
+    assert features[0] @ features[2] < 0.5
+
+def test_cross_platform_duplicate_keeps_cheaper_listing():
+    items = [
+        record("b1", "bunjang", "아이폰 15 프로 256GB 블랙", 1000000),
+        record("j1", "joongna", "아이폰15 프로 256gb 블랙", 950000),
+        record("b2", "bunjang", "에어팟 프로 2세대", 200000),
+    ]
+    assert sorted(ids(rank_items(items, "아이폰", "price_asc"))) == ["b2", "j1"]
+
+def test_same_platform_or_distant_price_is_not_a_duplicate():
+    items = [
+        record("b1", "bunjang", "아이폰 15 프로 256GB", 1000000),
+        record("b2", "bunjang", "아이폰 15 프로 256GB", 990000),
+        record("j1", "joongna", "아이폰 15 프로 256GB", 600000),
+    ]
+    assert sorted(ids(rank_items(items, "아이폰"))) == ["b1", "b2", "j1"]
+
+def test_price_sorts_are_stable():
+    items = [
+        record("a", "bunjang", "맥북 에어", 900000),
+        record("b", "bunjang", "아이패드", 500000),
+        record("c", "bunjang", "갤럭시탭", 500000),
+    ]
+    assert ids(rank_items(items, "", "price_asc")) == ["b", "c", "a"]
+    assert ids(rank_items(items, "", "price_desc")) == ["a", "b", "c"]
+
+def test_relevance_prefers_titles_matching_the_query():
+    items = [
+        record("other", "bunjang", "닌텐도 스위치", 300000),
+        record("phone", "bunjang", "아이폰 15 본체", 300000),
+    ]
+    assert ids(rank_items(items, "아이폰 15")) == ["phone", "other"]
+
+def test_relevance_breaks_ties_with_condition_tags():
+    items = [
+        record("used", "bunjang", "아이폰 15", 900000, ["사용감 많음"]),
+        record("new", "bunjang", "아이폰 15", 900000, ["새상품"]),
+    ]
+    assert ids(rank_items(items, "아이폰 15")) == ["new", "used"]
+
+def test_relevance_penalizes_suspiciously_cheap_listings():
+    items = [
+        record("bait", "bunjang", "아이폰 15", 100000),
+        record("fair", "bunjang", "아이폰 15", 900000),
+        record("fair2", "bunjang", "아이폰 15", 950000),
+    ]
+    assert ids(rank_items(items, "아이폰 15"))[-1] == "bait"
+
+def test_empty_input_is_returned_as_is():
+    assert rank_items([], "아이폰") == []
+
+def test_trigram_features_do_not_depend_on_hash_seed():
+    script = "from app.services.ranking import trigram_features; print(trigram_features(['아이폰 15 프로']).tobytes().hex())"
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
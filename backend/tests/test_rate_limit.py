@@ -0,0 +1,114 @@
+import asyncio
+import fakeredis
+import pytest
+from prometheus_client import REGISTRY
+from app.clients import rate_limit
+from app.clients.rate_limit import AdaptiveRateLimiter, UpstreamThrottledError
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+@pytest.fixture
+def make_limiter(monkeypatch):
+    def make(server=None, **overrides):
+        monkeypatch.setattr(rate_limit, "async_redis_client", fakeredis.FakeAsyncRedis(server=server or fakeredis.FakeServer(), decode_responses=True))
+        limiter = AdaptiveRateLimiter()
+        for name, value in overrides.items():
+            setattr(limiter, name, value)
+        return limiter
+    return make
+
+def test_burst_is_served_immediately_then_requests_queue(make_limiter):
+    limiter = make_limiter(initial_rate=100, burst=2, max_wait=1)
+
+    async def run():
+        for _ in range(3):
+            await limiter.acquire("burst.test")
+
+    asyncio.run(run())
+    assert sample("rate_limit_acquires_total", host="burst.test", outcome="immediate") == 2
+    assert sample("rate_limit_acquires_total", host="burst.test", outcome="queued") == 1
+    assert sample("rate_limit_wait_seconds_count", host="burst.test") == 3
+    assert 0 < sample("rate_limit_wait_seconds_sum", host="burst.test") <= 0.011
+
+def test_rejects_when_queue_exceeds_max_wait(make_limiter):
+    limiter = make_limiter(initial_rate=1, burst=1, max_wait=0.5)
+
+    async def run():
+        await limiter.acquire("reject.test")
+        with pytest.raises(UpstreamThrottledError):
+            await limiter.acquire("reject.test")
+
+    asyncio.run(run())
+    assert sample("rate_limit_acquires_total", host="reject.test", outcome="rejected") == 1
+
+def test_feedback_is_applied_on_the_next_acquire(make_limiter):
+    limiter = make_limiter(initial_rate=10, burst=100, min_rate=4, increase_step=1, decrease_factor=0.5, decrease_cooldown=60)
+
+    async def run():
+        rates = []
+        for successes, throttled in ((0, False), (2, False), (1, True), (0, True)):
+            for _ in range(successes):
+                limiter.record("aimd.test", throttled=False)
+            if throttled:
+                limiter.record("aimd.test", throttled=True)
+            await limiter.acquire("aimd.test")
+            rates.append(sample("rate_limit_rate", host="aimd.test"))
+        return rates
+
+    # 쿨다운 안의 두 번째 429는 속도를 다시 줄이지 않음
+    assert asyncio.run(run()) == [10, 12, 6, 6]
+    assert sample("upstream_throttled_responses_total", host="aimd.test") == 2
+
+def test_rate_stays_within_bounds(make_limiter):
+    limiter = make_limiter(initial_rate=10, burst=100, min_rate=4, max_rate=10.5, increase_step=1, decrease_cooldown=0)
+
+    async def run():
+        limiter.record("bounds.test", throttled=False)
+        await limiter.acquire("bounds.test")
+        upper = sample("rate_limit_rate", host="bounds.test")
+        for _ in range(3):
+            limiter.record("bounds.test", throttled=True)
+            await limiter.acquire("bounds.test")
+        return upper, sample("rate_limit_rate", host="bounds.test")
+
+    assert asyncio.run(run()) == (10.5, 4)
+
+def test_each_request_costs_one_redis_call(make_limiter):
+    limiter = make_limiter(initial_rate=100, burst=100)
+    script = limiter._acquire
+    calls = []
+
+    async def counted(**kwargs):
+        calls.append(kwargs)
+        return await script(**kwargs)
+
+    limiter._acquire = counted
+
+    async def run():
+        for throttled in (False, True, False):
+            await limiter.acquire("calls.test")
+            limiter.record("calls.test", throttled=throttled)
+
+    asyncio.run(run())
+    assert len(calls) == 3
+
+def test_default_burst_covers_a_cold_search_page(make_limiter):
+    limiter = make_limiter()
+
+    async def run():
+        # 목록 1건 + 상세 40건
+        for _ in range(41):
+            await limiter.acquire("page.test")
+
+    asyncio.run(run())
+    assert sample("rate_limit_acquires_total", host="page.test", outcome="queued") == 0
+    assert sample("rate_limit_acquires_total", host="page.test", outcome="rejected") == 0
+
+def test_redis_outage_does_not_block_requests(make_limiter):
+    server = fakeredis.FakeServer()
+    server.connected = False
+    limiter = make_limiter(server=server)
+
+    asyncio.run(limiter.acquire("outage.test"))
+    assert sample("rate_limit_acquires_total", host="outage.test", outcome="rejected") == 0
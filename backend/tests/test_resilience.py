@@ -0,0 +1,165 @@
+import asyncio
+import time
+import httpx
+import pytest
+from app.core.config import settings
+from prometheus_client import REGISTRY
+from app.clients.resilience import CircuitBreaker, CircuitOpenError, RetryBudget, circuit_breakers, hedged, resilient, retry_budgets
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+def status_error(code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://upstream.test")
+    return httpx.HTTPStatusError("upstream error", request=request, response=httpx.Response(code, request=request))
+
+def test_breaker_opens_after_threshold_and_short_circuits():
+    breaker = CircuitBreaker("open.test", failure_threshold=2, reset_timeout=60)
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert sample("circuit_breaker_events_total", upstream="open.test", event="opened") == 1
+    assert sample("circuit_breaker_events_total", upstream="open.test", event="short_circuited") == 1
+
+def test_half_open_allows_a_single_probe(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker("probe.test", failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+
+    now[0] = 10
+    breaker.before_call()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+def test_failed_probe_reopens_the_circuit(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker("reopen.test", failure_threshold=3, reset_timeout=10)
+    for _ in range(3):
+        breaker.record_failure()
+
+    now[0] = 10
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.opened_at == 10
+
+def test_retry_budget_refills_by_ratio_up_to_max():
+    budget = RetryBudget(ratio=0.5, max_tokens=2)
+    assert budget.withdraw() and budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+
+    for _ in range(10):
+        budget.deposit()
+    assert budget.tokens == 2
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(settings, "UPSTREAM_RETRY_BASE_DELAY", 0)
+    monkeypatch.setattr(settings, "UPSTREAM_RETRIES", 2)
+    monkeypatch.setattr(settings, "UPSTREAM_HEDGE_ENABLED", False)
+
+def test_resilient_retries_upstream_failures(no_backoff):
+    attempts = []
+
+    @resilient("retry.test")
+    async def call():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise status_error(503)
+        return "ok"
+
+    assert asyncio.run(call()) == "ok"
+    assert len(attempts) == 3
+    assert sample("upstream_retries_total", upstream="retry.test", outcome="retried") == 2
+
+def test_resilient_does_not_retry_client_errors(no_backoff):
+    attempts = []
+
+    @resilient("client_error.test")
+    async def call():
+        attempts.append(1)
+        raise status_error(404)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(call())
+    assert len(attempts) == 1
+
+def test_resilient_stops_when_retry_budget_is_exhausted(no_backoff):
+    @resilient("budget.test")
+    async def call():
+        raise status_error(500)
+
+    retry_budgets["budget.test"].tokens = 0
+    retry_budgets["budget.test"].ratio = 0
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(call())
+    assert sample("upstream_retries_total", upstream="budget.test", outcome="budget_exhausted") == 1
+    assert sample("upstream_retries_total", upstream="budget.test", outcome="retried") == 0
+
+def test_hedged_uses_the_faster_response():
+    delays = [0.2, 0.0]
+
+    async def call():
+        delay = delays.pop(0)
+        await asyncio.sleep(delay)
+        return delay
+
+    assert asyncio.run(hedged(call, delay=0.01, upstream="hedge.test")) == 0.0
+    assert sample("upstream_hedges_total", upstream="hedge.test", outcome="sent") == 1
+    assert sample("upstream_hedges_total", upstream="hedge.test", outcome="won") == 1
+
+def test_hedged_skips_the_second_request_when_first_is_fast():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return "fast"
+
+    assert asyncio.run(hedged(call, delay=1, upstream="fast.test")) == "fast"
+    assert len(calls) == 1
+
+def test_outer_timeout_on_a_slow_call_counts_as_failure(no_backoff, monkeypatch):
+    monkeypatch.setattr(settings, "UPSTREAM_SLOW_CALL_SECONDS", 0.01)
+
+    @resilient("slow.test")
+    async def call():
+        await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(call(), 0.05))
+    assert circuit_breakers["slow.test"].failures == 1
+
+def test_early_cancel_does_not_count_as_failure(no_backoff, monkeypatch):
+    monkeypatch.setattr(settings, "UPSTREAM_SLOW_CALL_SECONDS", 1)
+
+    @resilient("cancel.test")
+    async def call():
+        await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(call(), 0.01))
+    assert circuit_breakers["cancel.test"].failures == 0
+
+def test_endpoint_timeouts_leave_room_for_a_retry():
+    timeouts = settings.UPSTREAM_TIMEOUTS
+    retry = settings.UPSTREAM_RETRY_BASE_DELAY * 2
+    assert 2 * timeouts["search"] + retry < settings.PLATFORM_SEARCH_TIMEOUT
+    assert 2 * timeouts["detail"] + retry < settings.DETAIL_FETCH_TIMEOUT
+    assert 2 * timeouts["autocomplete"] + retry < settings.AUTOCOMPLETE_TIMEOUT
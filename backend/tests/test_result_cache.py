@@ -0,0 +1,47 @@
+import asyncio
+import fakeredis
+import pytest
+from app.services import result_cache as result_cache_module
+from app.services.records import ItemRecord
+from app.services.result_cache import SearchResultCache
+
+def make_result():
+    return {
+        "items": {"bunjang": [ItemRecord(item_id="1", platform="bunjang", name="아이폰", price=900000, thumbnail="", tags=["새상품"])]},
+        "platforms": [{"platform": "bunjang", "status": "ok", "item_count": 1, "elapsed_ms": 3, "error": None}],
+        "next_pages": {"bunjang": 1}
+    }
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(result_cache_module, "async_redis_client", fakeredis.FakeAsyncRedis(decode_responses=True))
+    return SearchResultCache()
+
+def test_local_hits_do_not_share_records(cache):
+    async def run():
+        original = make_result()
+        await cache.set("key", original)
+        original["items"]["bunjang"][0].tags.append("무료배송")
+
+        first = await cache.get("key")
+        first["items"]["bunjang"][0].price = 1
+        first["items"]["bunjang"][0].tags.clear()
+        first["next_pages"].clear()
+        return await cache.get("key")
+
+    second = asyncio.run(run())
+    assert second["items"]["bunjang"][0].price == 900000
+    assert second["items"]["bunjang"][0].tags == ["새상품"]
+    assert second["next_pages"] == {"bunjang": 1}
+
+def test_redis_hit_fills_local_cache_with_a_private_copy(cache):
+    async def run():
+        await cache.set("key", make_result())
+        cache.local.clear()
+        from_redis = await cache.get("key")
+        from_redis["items"]["bunjang"][0].name = "changed"
+        return from_redis, await cache.get("key")
+
+    from_redis, from_local = asyncio.run(run())
+    assert from_redis["items"]["bunjang"][0].name == "changed"
+    assert from_local["items"]["bunjang"][0].name == "아이폰"
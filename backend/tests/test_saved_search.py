@@ -0,0 +1,88 @@
+import asyncio
+from types import SimpleNamespace
+import fakeredis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api import saved_searches
+from app.api.deps import get_current_user
+from app.core.config import settings
+from app.database import get_async_db
+from app.services import saved_search as saved_search_module
+from app.services.records import ItemRecord
+from app.services.saved_search import SavedSearchScheduler
+from app.services.search import SearchService
+
+def item(item_id, price):
+    return ItemRecord(item_id=item_id, platform="bunjang", name=f"아이폰 {item_id}", price=price, thumbnail="")
+
+def page(items):
+    return {
+        "items": {"bunjang": items},
+        "platforms": [{"platform": "bunjang", "status": "ok", "item_count": len(items), "elapsed_ms": 1, "error": None}],
+        "next_pages": {}
+    }
+
+def test_poll_reports_only_new_items_within_each_price_range(monkeypatch):
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(saved_search_module, "async_redis_client", redis)
+    pages = [page([item("1", 500000)]), page([item("1", 500000), item("2", 800000), item("3", 1200000)])]
+    requests = []
+
+    async def fetch_latest(query, platform="all"):
+        requests.append((query, platform))
+        return pages.pop(0)
+
+    monkeypatch.setattr(saved_search_module.search_service, "fetch_latest", fetch_latest)
+    scheduler = SavedSearchScheduler()
+    group = [
+        SimpleNamespace(id=1, platform="all", min_price=None, max_price=1000000),
+        SimpleNamespace(id=2, platform="bunjang", min_price=1000000, max_price=None)
+    ]
+
+    async def run():
+        await scheduler._poll_query("아이폰", group)
+        await scheduler._poll_query("아이폰", group)
+        return await scheduler.get_matches(1), await scheduler.get_matches(2)
+
+    first, second = asyncio.run(run())
+    assert requests == [("아이폰", "all"), ("아이폰", "all")]
+    assert [match["item_id"] for match in first] == ["2"]
+    assert [match["item_id"] for match in second] == ["3"]
+
+def test_fetch_latest_lists_by_date_without_enrichment(monkeypatch):
+    service = SearchService()
+    calls = []
+
+    async def lister(query, page, page_size, sort="relevance"):
+        calls.append((query, page, sort))
+        return [item("1", 500000)], True
+
+    async def enrich(*args, **kwargs):
+        raise AssertionError("polling must not fetch item details")
+
+    service.listers = {"bunjang": lister}
+    monkeypatch.setattr(service, "_enrich_tags", enrich)
+    result = asyncio.run(service.fetch_latest("아이폰  15", "bunjang"))
+
+    assert calls == [("아이폰 15", 0, "date")]
+    assert [record.item_id for record in result["items"]["bunjang"]] == ["1"]
+    assert result["platforms"][0]["status"] == "ok"
+
+def test_create_rejects_saved_searches_over_the_per_user_limit():
+    class FakeSession:
+        added = []
+
+        async def scalar(self, statement):
+            return settings.SAVED_SEARCH_MAX_PER_USER
+
+        def add(self, saved_search):
+            self.added.append(saved_search)
+
+    app = FastAPI()
+    app.include_router(saved_searches.router)
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1)
+    app.dependency_overrides[get_async_db] = FakeSession
+    response = TestClient(app).post("/saved-searches/", json={"query": "아이폰", "platform": "all"})
+
+    assert response.status_code == 409
+    assert FakeSession.added == []
@@ -0,0 +1,47 @@
+import asyncio
+import pytest
+from app.core.config import settings
+from app.services import search as search_module
+from app.services.records import ItemRecord
+from app.services.search import SearchService
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(settings, "PLATFORM_SEARCH_TIMEOUT", 0.2)
+    monkeypatch.setattr(settings, "DETAIL_FETCH_TIMEOUT", 0.05)
+
+    async def load_many(platform, item_ids):
+        return {}
+
+    monkeypatch.setattr(search_module.detail_cache, "load_many", load_many)
+    return SearchService()
+
+def listing(delay=0.0):
+    async def lister(query, page, page_size, sort="relevance"):
+        await asyncio.sleep(delay)
+        items = [ItemRecord(item_id=str(i), platform="bunjang", name=f"item {i}", price=1000, thumbnail="") for i in range(3)]
+        return items, False
+    return lister
+
+def test_slow_detail_fetch_only_drops_its_own_tags(service, monkeypatch):
+    async def get_item_tags(item_id, platform, cached=None):
+        if item_id == "1":
+            await asyncio.sleep(1)
+        return [f"tag {item_id}"]
+
+    service.listers["bunjang"] = listing()
+    monkeypatch.setattr(service, "_get_item_tags", get_item_tags)
+
+    items, has_more = asyncio.run(service._search_platform("bunjang", "query", 0, 40))
+    assert [item.tags for item in items] == [["tag 0"], [], ["tag 2"]]
+
+def test_listing_deadline_reports_timeout(service, capsys):
+    service.listers["bunjang"] = listing(delay=1)
+
+    results = asyncio.run(search_module.fan_out({
+        "bunjang": lambda: service._search_platform("bunjang", "query", 0, 40)
+    }, timeout=None))
+    result = results["bunjang"]
+    assert result.status == "timeout"
+    assert result.error == "timeout"
+    assert "no response within 0.2s" in capsys.readouterr().out
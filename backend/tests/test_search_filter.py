@@ -0,0 +1,21 @@
+from app.services.records import ItemRecord
+from app.services.search import SearchService
+
+ITEMS = [
+    ItemRecord(item_id=item_id, platform="bunjang", name=f"item {item_id}", price=price, thumbnail="")
+    for item_id, price in (("1", 5000), ("2", 15000), ("3", 30000))
+]
+
+def ids(items):
+    return [item.item_id for item in items]
+
+def test_without_bounds_keeps_every_item():
+    assert ids(SearchService.filter_by_price(ITEMS)) == ["1", "2", "3"]
+
+def test_min_and_max_price_are_inclusive():
+    assert ids(SearchService.filter_by_price(ITEMS, min_price=15000)) == ["2", "3"]
+    assert ids(SearchService.filter_by_price(ITEMS, max_price=15000)) == ["1", "2"]
+    assert ids(SearchService.filter_by_price(ITEMS, 10000, 20000)) == ["2"]
+
+def test_empty_range_returns_no_items():
+    assert SearchService.filter_by_price(ITEMS, min_price=40000) == []
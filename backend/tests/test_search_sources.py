@@ -0,0 +1,141 @@
+import asyncio
+import pytest
+from app.services import search as search_module
+from app.services.item_index import ItemIndexUnavailableError
+from app.services.records import ItemRecord, SearchResult
+from app.services.search import SearchService
+
+ITEM = ItemRecord(item_id="1", platform="bunjang", name="아이폰 15", price=900000, thumbnail="")
+
+def live_result(query, platform):
+    return SearchResult(
+        items=[ITEM],
+        item_count=1,
+        query=query,
+        platform=platform,
+        platforms=[{"platform": "bunjang", "status": "ok", "item_count": 1, "elapsed_ms": 1, "error": None}]
+    )
+
+@pytest.fixture
+def service(monkeypatch):
+    service = SearchService()
+
+    async def search_live(query, platform, *args):
+        return live_result(query, platform)
+
+    async def index_down(*args, **kwargs):
+        raise ItemIndexUnavailableError("Item index read failed: connection refused")
+
+    monkeypatch.setattr(service, "_search_live", search_live)
+    monkeypatch.setattr(search_module.item_index, "search", index_down)
+    return service
+
+def test_hybrid_falls_back_to_live_when_index_is_down(service):
+    result = asyncio.run(service.search_items("아이폰", "bunjang", source="hybrid"))
+    assert result.items == [ITEM]
+    assert result.platforms[0]["status"] == "ok"
+
+def test_local_search_surfaces_index_outage(service):
+    with pytest.raises(ItemIndexUnavailableError):
+        asyncio.run(service.search_items("아이폰", "bunjang", source="local"))
+
+def test_index_write_does_not_block_search(monkeypatch):
+    service = SearchService()
+    written = []
+
+    async def lister(query, page, page_size, sort="relevance"):
+        return [ITEM], False
+
+    async def enrich(items, platform, events=None):
+        return items
+
+    async def record(*args):
+        pass
+
+    async def cache_set(key, value):
+        pass
+
+    async def slow_upsert(items):
+        await asyncio.sleep(0.05)
+        written.extend(items)
+
+    service.listers = {"bunjang": lister}
+    monkeypatch.setattr(service, "_enrich_tags", enrich)
+    monkeypatch.setattr(search_module.price_stats, "record", record)
+    monkeypatch.setattr(search_module.search_result_cache, "set", cache_set)
+    monkeypatch.setattr(search_module.item_index, "upsert", slow_upsert)
+
+    async def run():
+        result = await service._search_unfiltered("key", "아이폰", {"bunjang": 0}, 40)
+        pending = list(written)
+        await search_module.item_index.close()
+        return result, pending
+
+    result, pending = asyncio.run(run())
+    assert result["items"]["bunjang"] == [ITEM]
+    assert pending == []
+    assert written == [ITEM]
+
+def test_live_price_sort_is_passed_to_the_upstream_listing(monkeypatch):
+    service = SearchService()
+    sorts = []
+
+    async def lister(query, page, page_size, sort="relevance"):
+        sorts.append(sort)
+        return [ITEM], True
+
+    async def enrich(items, platform, events=None):
+        return items
+
+    async def record(*args):
+        pass
+
+    async def cache_get(key):
+        return None
+
+    async def cache_set(key, value):
+        pass
+
+    service.listers = {"bunjang": lister}
+    monkeypatch.setattr(service, "_enrich_tags", enrich)
+    monkeypatch.setattr(search_module.price_stats, "record", record)
+    monkeypatch.setattr(search_module.search_result_cache, "get", cache_get)
+    monkeypatch.setattr(search_module.search_result_cache, "set", cache_set)
+    monkeypatch.setattr(search_module.item_index, "upsert_later", lambda items: None)
+
+    async def run():
+        first = await service.search_items("아이폰", "bunjang", sort="price_asc")
+        second = await service.search_items("아이폰", "bunjang", cursor=first.next_cursor, sort="price_asc")
+        with pytest.raises(ValueError):
+            await service.search_items("아이폰", "bunjang", cursor=first.next_cursor, sort="relevance")
+        return second
+
+    asyncio.run(run())
+    assert sorts == ["price_asc", "price_asc"]
+
+def test_hybrid_top_up_fills_one_page_and_resumes_inside_the_live_page(monkeypatch):
+    service = SearchService()
+    local_items = [ItemRecord(item_id=f"local{i}", platform="bunjang", name=f"아이폰 {i}", price=100000 * (i + 1), thumbnail="") for i in range(2)]
+    live_items = [ItemRecord(item_id=f"live{i}", platform="bunjang", name=f"아이폰 {i}", price=200000 * (i + 1), thumbnail="") for i in range(5)]
+
+    async def search_index(*args, **kwargs):
+        return list(local_items)
+
+    async def load_page(query, platform, pages, page_size, sort="relevance"):
+        return {
+            "items": {"bunjang": [item.copy() for item in live_items]},
+            "platforms": [{"platform": "bunjang", "status": "ok", "item_count": 5, "elapsed_ms": 1, "error": None}],
+            "next_pages": {"bunjang": pages["bunjang"] + 1}
+        }
+
+    monkeypatch.setattr(search_module.item_index, "search", search_index)
+    monkeypatch.setattr(service, "_load_page", load_page)
+
+    async def run():
+        first = await service.search_items("아이폰", "bunjang", page_size=4, sort="price_asc", source="hybrid")
+        second = await service.search_items("아이폰", "bunjang", cursor=first.next_cursor, page_size=4, sort="price_asc", source="hybrid")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert [item.item_id for item in first.items] == ["local0", "local1", "live0", "live1"]
+    assert [item.item_id for item in second.items] == ["live2", "live3", "live4"]
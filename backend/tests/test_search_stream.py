@@ -0,0 +1,74 @@
+import asyncio
+import pytest
+from app.services import search as search_module
+from app.services.records import ItemRecord
+from app.services.search import SearchService
+
+@pytest.fixture
+def service(monkeypatch):
+    service = SearchService()
+    service.calls = {"listing": 0, "recorded": [], "cached": {}, "indexed": []}
+
+    async def lister(query, page, page_size, sort="relevance"):
+        service.calls["listing"] += 1
+        await asyncio.sleep(0.01)
+        return [
+            ItemRecord(item_id="1", platform="bunjang", name="아이폰 케이스", price=1000, thumbnail=""),
+            ItemRecord(item_id="2", platform="bunjang", name="아이폰 15", price=900000, thumbnail="")
+        ], True
+
+    async def fetch_tags(item, platform, cached=None):
+        return [f"tag {item.item_id}"]
+
+    async def load_many(platform, item_ids):
+        return {}
+
+    async def cache_get(key):
+        return None
+
+    async def cache_set(key, value):
+        service.calls["cached"][key] = value
+
+    async def record(platform, query, items):
+        service.calls["recorded"].append((platform, len(items)))
+
+    service.listers = {"bunjang": lister}
+    monkeypatch.setattr(service, "_fetch_tags", fetch_tags)
+    monkeypatch.setattr(search_module.detail_cache, "load_many", load_many)
+    monkeypatch.setattr(search_module.search_result_cache, "get", cache_get)
+    monkeypatch.setattr(search_module.search_result_cache, "set", cache_set)
+    monkeypatch.setattr(search_module.price_stats, "record", record)
+    monkeypatch.setattr(search_module.item_index, "upsert_later", service.calls["indexed"].extend)
+    return service
+
+async def collect(events):
+    return [event async for event in events]
+
+def test_stream_miss_fills_cache_and_side_effects(service):
+    events = asyncio.run(collect(service.stream_items("아이폰", "bunjang", min_price=10000)))
+
+    assert [event["event"] for event in events] == ["items", "tags", "status", "done"]
+    assert [item["item_id"] for item in events[0]["items"]] == ["2"]
+    assert events[1]["item_id"] == "2"
+    assert events[2]["item_count"] == 1
+    assert events[3]["next_cursor"] is not None
+
+    # 캐시에는 가격 필터 전 결과가 태그와 함께 저장됨
+    (cached,) = service.calls["cached"].values()
+    assert [item.tags for item in cached["items"]["bunjang"]] == [["tag 1"], ["tag 2"]]
+    assert service.calls["recorded"] == [("bunjang", 2)]
+    assert [item.item_id for item in service.calls["indexed"]] == ["1", "2"]
+
+def test_stream_shares_the_search_flight(service):
+    async def run():
+        pages = {"bunjang": 0}
+        return await asyncio.gather(
+            service._load_page("아이폰", "bunjang", pages, 40),
+            collect(service.stream_items("아이폰", "bunjang", page_size=40))
+        )
+
+    result, events = asyncio.run(run())
+    assert service.calls["listing"] == 1
+    assert [item["item_id"] for item in events[0]["items"]] == ["1", "2"]
+    assert events[0]["items"][0]["tags"] == ["tag 1"]
+    assert [event["event"] for event in events] == ["items", "status", "done"]
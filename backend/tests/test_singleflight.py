@@ -0,0 +1,62 @@
+import asyncio
+import pytest
+from app.utils.singleflight import SingleFlight
+
+def test_concurrent_callers_share_one_call():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def run():
+        group = SingleFlight()
+        return await asyncio.gather(*(group.do("key", fetch) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["value"] * 5
+    assert len(calls) == 1
+
+def test_key_is_released_after_completion():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return len(calls)
+
+    async def run():
+        group = SingleFlight()
+        first = await group.do("key", fetch)
+        second = await group.do("key", fetch)
+        return first, second
+
+    assert asyncio.run(run()) == (1, 2)
+
+def test_errors_propagate_to_every_waiter():
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run():
+        group = SingleFlight()
+        return await asyncio.gather(group.do("key", fetch), group.do("key", fetch), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+def test_cancelled_waiter_does_not_cancel_shared_call():
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def run():
+        group = SingleFlight()
+        first = asyncio.ensure_future(group.do("key", fetch))
+        second = asyncio.ensure_future(group.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "done"
@@ -0,0 +1,103 @@
+import asyncio
+import fakeredis
+import pytest
+from sqlalchemy.dialects import postgresql
+from app.services import tag_store as tag_store_module
+from app.services.tag_store import TagStore
+
+ITEM = {"title": "아이폰 15", "description": "깨끗해요", "category": "휴대폰", "item_tags": "직거래"}
+
+class FakeDatabase:
+    def __init__(self):
+        self.rows = {}
+        self.statements = []
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def get(self, model, content_hash):
+        return self.rows.get(content_hash)
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        params = statement.compile(dialect=postgresql.dialect()).params
+        self.rows.setdefault(params["content_hash"], type("Row", (), {"tags": params["tags"]}))
+
+    async def commit(self):
+        pass
+
+@pytest.fixture
+def store(monkeypatch):
+    database = FakeDatabase()
+    monkeypatch.setattr(tag_store_module, "async_redis_client", fakeredis.FakeAsyncRedis(decode_responses=True))
+    monkeypatch.setattr(tag_store_module, "AsyncSessionLocal", database)
+    store = TagStore()
+    store.database = database
+    return store
+
+def generator(calls, tags=("직거래", "새상품")):
+    async def generate():
+        calls.append(1)
+        return list(tags)
+    return generate
+
+def test_generated_tags_are_reused_from_the_local_tier(store):
+    calls = []
+
+    async def run():
+        first = await store.get_or_generate(ITEM, "exaone", "1", generator(calls))
+        first.append("변경")
+        return await store.get_or_generate(ITEM, "exaone", "1", generator(calls))
+
+    assert asyncio.run(run()) == ["직거래", "새상품"]
+    assert calls == [1]
+
+def test_redis_tier_serves_other_workers(store):
+    calls = []
+
+    async def run():
+        await store.get_or_generate(ITEM, "exaone", "1", generator(calls))
+        store.database.rows.clear()
+        store.local.clear()
+        return await store.get_or_generate(ITEM, "exaone", "1", generator(calls))
+
+    assert asyncio.run(run()) == ["직거래", "새상품"]
+    assert calls == [1]
+
+def test_database_tier_refills_redis(store):
+    calls = []
+
+    async def run():
+        await store.get_or_generate(ITEM, "exaone", "1", generator(calls))
+        await tag_store_module.async_redis_client.flushall()
+        store.local.clear()
+        tags = await store.get_or_generate(ITEM, "exaone", "1", generator(calls))
+        content_hash = store.content_hash(ITEM, "exaone", "1")
+        return tags, await tag_store_module.async_redis_client.get(f"generated_tags:{content_hash}")
+
+    tags, hot = asyncio.run(run())
+    assert tags == ["직거래", "새상품"]
+    assert hot is not None
+    assert calls == [1]
+
+def test_prompt_version_changes_the_key(store):
+    calls = []
+
+    async def run():
+        await store.get_or_generate(ITEM, "exaone", "1", generator(calls))
+        return await store.get_or_generate(ITEM, "exaone", "2", generator(calls, tags=("택배 거래",)))
+
+    assert asyncio.run(run()) == ["택배 거래"]
+    assert calls == [1, 1]
+    assert store.content_hash(ITEM, "exaone", "1") != store.content_hash(ITEM, "exaone", "2")
+
+def test_persist_ignores_concurrent_inserts(store):
+    asyncio.run(store._persist("hash", "exaone", "1", ["직거래"]))
+    sql = str(store.database.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (content_hash) DO NOTHING" in sql
@@ -22,7 +22,7 @@ import Header from "../../components/Header";
 import LoadingSpinner from "../../components/LoadingSpinner";
 
 interface SearchFilters {
-    platform: "all" | "bunjang" | "joonggonara";
+    platform: "all" | "bunjang" | "joongna";
     minPrice: string;
     maxPrice: string;
     sortBy: "price_asc" | "price_desc" | "name_asc" | "name_desc";
@@ -134,12 +134,6 @@ function SearchPageContent() {
                 fallbackIcon: "🏠",
                 color: "bg-green-100 text-green-800",
             },
-            joonggonara: {
-                name: "중고나라",
-                logo: "/images/joongna-logo.png",
-                fallbackIcon: "🏠",
-                color: "bg-green-100 text-green-800",
-            },
         };
 
         return (
@@ -155,7 +149,7 @@ function SearchPageContent() {
     const handleItemClick = (item: ItemDetail) => {
         const platformUrls = {
             bunjang: `https://m.bunjang.co.kr/products/${item.item_id}`,
-            joonggonara: `https://web.joongna.com/product/${item.item_id}`,
+            joongna: `https://web.joongna.com/product/${item.item_id}`,
         };
 
         const url = platformUrls[item.platform as keyof typeof platformUrls];
@@ -236,7 +230,7 @@ function SearchPageContent() {
                                     >
                                         <option value="all">전체</option>
                                         <option value="bunjang">번개장터</option>
-                                        <option value="joonggonara">중고나라</option>
+                                        <option value="joongna">중고나라</option>
                                     </select>
                                 </div>
 
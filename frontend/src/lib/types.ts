@@ -76,7 +76,7 @@ export interface GetAutocompleteResponse {
 
 export interface SearchParams {
     query: string;
-    platform?: "bunjang" | "joonggonara" | "all";
+    platform?: "bunjang" | "joongna" | "all";
     min_price?: number;
     max_price?: number;
 }